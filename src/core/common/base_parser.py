@@ -1,6 +1,8 @@
 """Base implementation for source file parsers."""
 
+import errno
 import logging
+import stat
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
@@ -9,6 +11,11 @@ from ..protocols import SourceFileParser
 
 logger = logging.getLogger(__name__)
 
+# errnos that Path.exists() reports as "missing" rather than raising
+_MISSING_PATH_ERRNOS = frozenset(
+    {errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP}
+)
+
 
 class BaseSourceFileParser(SourceFileParser, ABC):
     """
@@ -119,35 +126,49 @@ class BaseSourceFileParser(SourceFileParser, ABC):
             FileNotFoundError: If the file doesn't exist
             ValueError: If the file extension is not supported
         """
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
-
-        if not file_path.is_file():
+        # One stat() answers both "does it exist" and "is it a regular file"
+        try:
+            st = file_path.stat()
+        except OSError as e:
+            if e.errno not in _MISSING_PATH_ERRNOS:
+                raise
+            raise FileNotFoundError(f"File not found: {file_path}") from None
+        except ValueError:
+            # Path.exists() also treats non-encodable paths as missing
+            raise FileNotFoundError(f"File not found: {file_path}") from None
+
+        if not stat.S_ISREG(st.st_mode):
             raise ValueError(f"Path is not a file: {file_path}")
 
-        supported_extensions = self.get_supported_extensions()
-        if supported_extensions:
-            # Check for exact suffix match first
-            if file_path.suffix in supported_extensions:
-                return
-
-            # Check for multi-part extensions (e.g., .tf.json)
-            for ext in supported_extensions:
-                if file_path.name.endswith(ext):
-                    return
-
-            # No match found
+        suffixes = self._get_extension_suffixes()
+        # A single endswith also covers multi-part extensions (e.g., .tf.json)
+        if suffixes and not file_path.name.endswith(suffixes):
             raise ValueError(
                 f"Unsupported file extension. "
-                f"Supported extensions: {supported_extensions}"
+                f"Supported extensions: {self.get_supported_extensions()}"
             )
 
+    def _get_extension_suffixes(self) -> tuple[str, ...]:
+        """
+        Return the supported extensions as a tuple, computed once per parser.
+
+        Returns:
+            Tuple of extensions usable with str.endswith (empty accepts all files)
+        """
+        # Read defensively: subclasses may not call super().__init__()
+        suffixes: tuple[str, ...] | None = getattr(self, "_extension_suffixes", None)
+        if suffixes is None:
+            suffixes = tuple(self.get_supported_extensions())
+            self._extension_suffixes = suffixes
+        return suffixes
+
     def _read_file(self, file_path: Path) -> str:
         """
         Reads the file content as text.
 
-        Subclasses may override to handle special cases
-        (e.g., encodings, compressed files).
+        The file is read as bytes and decoded in one step, so line endings are
+        returned as stored (no newline translation). Subclasses may override
+        to handle special cases (e.g., encodings, compressed files).
 
         Args:
             file_path: Path of the file to read.
@@ -161,7 +182,7 @@ class BaseSourceFileParser(SourceFileParser, ABC):
         """
 
         try:
-            return file_path.read_text(encoding=self.encoding)
+            return file_path.read_bytes().decode(self.encoding)
         except UnicodeDecodeError:
             self._logger.error(
                 f"Failed to decode file {file_path} with encoding {self.encoding}"
@@ -204,23 +225,13 @@ class BaseSourceFileParser(SourceFileParser, ABC):
             True if this parser can handle the file, False otherwise
         """
         try:
-            if not (file_path.exists() and file_path.is_file()):
+            # is_file() is False for missing paths, so no exists() is needed
+            if not file_path.is_file():
                 return False
 
-            supported_extensions = self.get_supported_extensions()
-            if not supported_extensions:
-                return True
-
-            # Check for exact suffix match first
-            if file_path.suffix in supported_extensions:
-                return True
-
-            # Check for multi-part extensions (e.g., .tf.json)
-            for ext in supported_extensions:
-                if file_path.name.endswith(ext):
-                    return True
-
-            return False
+            suffixes = self._get_extension_suffixes()
+            # A single endswith also covers multi-part extensions (e.g., .tf.json)
+            return not suffixes or file_path.name.endswith(suffixes)
         except Exception:
             return False
 
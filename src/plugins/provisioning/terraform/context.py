@@ -7,6 +7,7 @@ eliminating the need for circular dependencies and stack inspection anti-pattern
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -99,16 +100,7 @@ class TerraformMappingContext:
         # Try two approaches: configuration (for plans) or depends_on (for state)
 
         # Approach 1: Extract from configuration (terraform plan JSON)
-        configuration = self.parsed_data.get("configuration", {})
-        if not configuration:
-            # Try to get configuration from plan sub-object
-            plan_data = self.parsed_data.get("plan", {})
-            configuration = plan_data.get("configuration", {})
-
-        if configuration:
-            references.extend(
-                self._extract_from_configuration(resource_address, configuration)
-            )
+        references.extend(self._extract_from_configuration(resource_address))
 
         # Approach 2: Extract from depends_on (terraform state JSON)
         depends_on = resource_data.get("depends_on", [])
@@ -183,21 +175,31 @@ class TerraformMappingContext:
 
         return resolved_references
 
+    @cached_property
+    def _config_resources_by_address(self) -> dict[str, dict[str, Any]]:
+        """Index the root module configuration resources by address."""
+        configuration = self.parsed_data.get("configuration", {})
+        if not configuration:
+            # Try to get configuration from plan sub-object
+            plan_data = self.parsed_data.get("plan", {})
+            configuration = plan_data.get("configuration", {})
+        if not configuration:
+            return {}
+
+        root_module = configuration.get("root_module", {})
+        by_address: dict[str, dict[str, Any]] = {}
+        for config_res in root_module.get("resources", []):
+            # Keep the first match, as the former linear scan did
+            by_address.setdefault(config_res.get("address"), config_res)
+        return by_address
+
     def _extract_from_configuration(
-        self, resource_address: str, configuration: dict[str, Any]
+        self, resource_address: str
     ) -> list[tuple[str, str, str]]:
         """Extract references from configuration expressions (plan JSON)."""
         references: list[tuple[str, str, str]] = []
 
-        root_module = configuration.get("root_module", {})
-        config_resources = root_module.get("resources", [])
-
-        config_resource: dict[str, Any] | None = None
-        for config_res in config_resources:
-            if config_res.get("address") == resource_address:
-                config_resource = config_res
-                break
-
+        config_resource = self._config_resources_by_address.get(resource_address)
         if not config_resource:
             return references
 
@@ -211,9 +213,7 @@ class TerraformMappingContext:
                         continue
 
                     # Clean up the reference by removing .id suffix if present
-                    clean_ref = ref
-                    if ref.endswith(".id"):
-                        clean_ref = ref[:-3]
+                    clean_ref = ref.removesuffix(".id")
 
                     # Parse the reference to better understand its structure
                     components = (
@@ -256,23 +256,59 @@ class TerraformMappingContext:
 
         return references
 
+    @staticmethod
+    def _index_resources_by_id(
+        module_values: dict[str, Any] | None,
+    ) -> dict[tuple[str, str], str]:
+        """Map (type, id) to address for a root module's resources."""
+        index: dict[tuple[str, str], str] = {}
+        if not module_values:
+            return index
+
+        root_module = module_values.get("root_module", {})
+        for resource in root_module.get("resources", []):
+            resource_id = (resource.get("values") or {}).get("id")
+            if isinstance(resource_id, str):
+                # Keep the first match, as a linear scan would
+                index.setdefault(
+                    (resource.get("type"), resource_id), resource.get("address")
+                )
+        return index
+
+    @cached_property
+    def _state_resources_by_id(self) -> dict[tuple[str, str], str]:
+        """Index state resources by (type, id)."""
+        state_data = self.parsed_data.get("state", {})
+        return self._index_resources_by_id(state_data.get("values", {}))
+
+    @cached_property
+    def _planned_resources_by_id(self) -> dict[tuple[str, str], str]:
+        """Index planned_values resources by (type, id)."""
+        return self._index_resources_by_id(self.parsed_data.get("planned_values", {}))
+
     def _find_resource_by_id(self, resource_id: str, resource_type: str) -> str | None:
         """Find a resource address by its ID and type."""
         # Look in structured state data
-        state_data = self.parsed_data.get("state", {})
-        values = state_data.get("values", {})
-        if values:
-            root_module = values.get("root_module", {})
-            resources = root_module.get("resources", [])
+        return self._state_resources_by_id.get((resource_type, resource_id))
 
-            for resource in resources:
-                if (
-                    resource.get("type") == resource_type
-                    and resource.get("values", {}).get("id") == resource_id
-                ):
-                    return resource.get("address")
+    def find_resource_address_by_id(
+        self, resource_id: str, resource_type: str
+    ) -> str | None:
+        """
+        Find a resource address by its concrete ID, in state then planned_values.
 
-        return None
+        Args:
+            resource_id: Concrete resource ID (e.g., 'subnet-123abc').
+            resource_type: Terraform resource type (e.g., 'aws_subnet').
+
+        Returns:
+            Terraform address (e.g., 'aws_subnet.public') or None if not found.
+        """
+        key = (resource_type, resource_id)
+        address = self._state_resources_by_id.get(key)
+        if address is None:
+            address = self._planned_resources_by_id.get(key)
+        return address
 
     def get_resolved_values(
         self, resource_data: dict[str, Any], context: str = "property"
@@ -304,18 +340,14 @@ class TerraformMappingContext:
             # No resource address, can't resolve variables
             return original_values
 
-        resolved_values = {}
-
-        for prop_name, original_value in original_values.items():
-            resolved_value = self.variable_context.resolve_property(
-                resource_address, prop_name, context
-            )
+        resolved_values = self.variable_context.resolve_resource_properties(
+            resource_address, original_values, context
+        )
 
-            # If resolution didn't change the value, use the original
+        # If resolution didn't yield a value, use the original
+        for prop_name, resolved_value in resolved_values.items():
             if resolved_value is None:
-                resolved_values[prop_name] = original_value
-            else:
-                resolved_values[prop_name] = resolved_value
+                resolved_values[prop_name] = original_values[prop_name]
 
         return resolved_values
 
@@ -1,8 +1,10 @@
+import inspect
 import logging
 from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any
 
 from src.core.common.base_mapper import BaseResourceMapper
+from src.core.protocols import SingleResourceMapper
 
 from .context import TerraformMappingContext
 from .variables import VariableContext
@@ -27,6 +29,11 @@ class TerraformMapper(BaseResourceMapper):
         self._current_parsed_data: dict[str, Any] | None = None
         # Variable context for handling Terraform variables
         self._variable_context: VariableContext | None = None
+        # Mapping context shared by every sub-mapper during one map() run
+        self._mapping_context: TerraformMappingContext | None = None
+        # Whether each registered mapper's map_resource accepts a context,
+        # keyed by mapper instance so the signature is inspected only once
+        self._accepts_context: dict[SingleResourceMapper, bool] = {}
 
     def map(
         self,
@@ -42,6 +49,9 @@ class TerraformMapper(BaseResourceMapper):
         # Initialize variable context with combined plan and state data
         self._logger.info("Initializing variable context...")
         self._variable_context = VariableContext(parsed_data)
+        self._mapping_context = TerraformMappingContext(
+            parsed_data=parsed_data, variable_context=self._variable_context
+        )
 
         # Add TOSCA inputs from Terraform variables
         if self._variable_context.has_variables():
@@ -66,7 +76,7 @@ class TerraformMapper(BaseResourceMapper):
                     **input_kwargs,
                 )
                 self._logger.debug(
-                    f"Added TOSCA input: {input_name} ({input_def.param_type})"
+                    "Added TOSCA input: %s (%s)", input_name, input_def.param_type
                 )
 
             # Log variable usage summary for debugging
@@ -138,11 +148,11 @@ class TerraformMapper(BaseResourceMapper):
             # Uses can_map for a finer check
             if mapper_strategy.can_map(resource_type, resource_data):
                 self._logger.debug(
-                    f"Mapping resource '{resource_name}' ({resource_type})"
+                    "Mapping resource '%s' (%s)", resource_name, resource_type
                 )
 
-                # Create context object for dependency injection first
-                context = TerraformMappingContext(
+                # Reuse the run's context so its lookup caches persist
+                context = self._mapping_context or TerraformMappingContext(
                     parsed_data=self._current_parsed_data or {},
                     variable_context=self._variable_context,
                 )
@@ -165,10 +175,7 @@ class TerraformMapper(BaseResourceMapper):
                 self._tosca_node_mapping[resource_name] = tosca_node_name
 
                 # Check if mapper supports context parameter
-                import inspect
-
-                sig = inspect.signature(mapper_strategy.map_resource)
-                if "context" in sig.parameters:
+                if self._mapper_accepts_context(mapper_strategy):
                     # Delegates work to the specific strategy class with context
                     mapper_strategy.map_resource(
                         resource_name, resource_type, resource_data, builder, context
@@ -176,23 +183,34 @@ class TerraformMapper(BaseResourceMapper):
                 else:
                     # Fallback for mappers that don't support context yet
                     self._logger.debug(
-                        f"Mapper {mapper_strategy.__class__.__name__} does not support "
-                        "context parameter yet"
+                        "Mapper %s does not support context parameter yet",
+                        mapper_strategy.__class__.__name__,
                     )
                     mapper_strategy.map_resource(
                         resource_name, resource_type, resource_data, builder
                     )
             else:
                 self._logger.warning(
-                    f"The mapper for '{resource_type}' cannot handle "
-                    f"the specific configuration of '{resource_name}'. "
-                    "Skipping."
+                    "The mapper for '%s' cannot handle "
+                    "the specific configuration of '%s'. "
+                    "Skipping.",
+                    resource_type,
+                    resource_name,
                 )
         else:
             self._logger.warning(
-                f"No mapper registered for resource type: '{resource_type}'. Skipping."
+                "No mapper registered for resource type: '%s'. Skipping.", resource_type
             )
 
+    def _mapper_accepts_context(self, mapper_strategy: SingleResourceMapper) -> bool:
+        """Return True if the mapper's map_resource takes a context argument."""
+        accepts = self._accepts_context.get(mapper_strategy)
+        if accepts is None:
+            sig = inspect.signature(mapper_strategy.map_resource)
+            accepts = "context" in sig.parameters
+            self._accepts_context[mapper_strategy] = accepts
+        return accepts
+
     def _process_outputs(self, builder: "ServiceTemplateBuilder") -> None:
         """Process Terraform outputs and add them to the TOSCA service template."""
         if not self._variable_context:
@@ -209,7 +227,7 @@ class TerraformMapper(BaseResourceMapper):
                 self._logger.info("No outputs to process")
                 return
 
-            self._logger.info(f"Processing {len(tosca_outputs)} outputs")
+            self._logger.info("Processing %d outputs", len(tosca_outputs))
 
             # Add each output to the service template
             for output_name, tosca_output in tosca_outputs.items():
@@ -218,12 +236,12 @@ class TerraformMapper(BaseResourceMapper):
                     output_kwargs["description"] = tosca_output.description
 
                 builder.with_output(name=output_name, **output_kwargs)
-                self._logger.debug(f"Added output '{output_name}' to service template")
+                self._logger.debug("Added output '%s' to service template", output_name)
 
             self._logger.info("Successfully processed all outputs")
 
         except Exception as e:
-            self._logger.error(f"Error processing outputs: {e}")
+            self._logger.error("Error processing outputs: %s", e)
             # Don't re-raise - outputs are not critical for basic functionality
 
     def get_current_parsed_data(self) -> dict[str, Any]:
@@ -326,18 +344,13 @@ class TerraformMapper(BaseResourceMapper):
             if isinstance(expr_data, dict) and "references" in expr_data:
                 terraform_refs = expr_data["references"]
                 for ref in set(terraform_refs):  # avoid duplicates
-                    if ref and ref.endswith(".id"):
+                    if ref:
                         # Strip `.id` to get the clean reference
-                        clean_ref = ref[:-3]
+                        clean_ref = ref.removesuffix(".id")
                         rel = TerraformMapper._determine_terraform_relationship_type(
                             prop_name, clean_ref
                         )
                         references.append((prop_name, clean_ref, rel))
-                    elif ref:
-                        rel = TerraformMapper._determine_terraform_relationship_type(
-                            prop_name, ref
-                        )
-                        references.append((prop_name, ref, rel))
 
         return references
 
@@ -473,7 +486,7 @@ class TerraformMapper(BaseResourceMapper):
                 continue
 
             self._logger.debug(
-                f"Found resource: {full_address} (Type: {resource_type})"
+                "Found resource: %s (Type: %s)", full_address, resource_type
             )
             # Return full address as name, type, and raw data
             yield full_address, resource_type, resource
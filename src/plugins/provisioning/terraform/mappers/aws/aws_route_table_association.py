@@ -1,4 +1,5 @@
 import logging
+import re
 from typing import TYPE_CHECKING, Any
 
 from src.core.common.base_mapper import BaseResourceMapper
@@ -10,6 +11,19 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Gateway resource types that can be associated with a route table
+_GATEWAY_TYPES = (
+    "aws_internet_gateway",
+    "aws_egress_only_internet_gateway",
+    "aws_vpn_gateway",
+    "aws_nat_gateway",
+)
+_GATEWAY_TYPE_SET = frozenset(_GATEWAY_TYPES)
+# Matches the gateway type inside a Terraform address or TOSCA node name. No
+# type is a substring of another, so the alternation order is irrelevant; if an
+# address names several types, the leftmost one wins (not the tuple order).
+_GATEWAY_TYPE_RE = re.compile("|".join(map(re.escape, _GATEWAY_TYPES)))
+
 
 class AWSRouteTableAssociationMapper(SingleResourceMapper):
     """Map a Terraform 'aws_route_table_association' resource to TOSCA relationships.
@@ -101,16 +115,46 @@ class AWSRouteTableAssociationMapper(SingleResourceMapper):
             # Already a TOSCA node name
             route_table_node_name = route_table_address
 
+        # Both associations target the same route table, so check it once
+        if not self._find_node_in_builder(builder, route_table_node_name):
+            logger.warning(
+                "Route table node '%s' not found. The aws_route_table mapper may not "
+                "have run yet. Route table association for '%s' will be skipped.",
+                route_table_node_name,
+                resource_name,
+            )
+            return
+
         # Process subnet association
         if subnet_address:
-            self._process_subnet_association(
-                builder, subnet_address, route_table_node_name, resource_name, context
+            self._process_association(
+                builder,
+                subnet_address,
+                "aws_subnet",
+                route_table_node_name,
+                resource_name,
+                "subnet",
+                context,
             )
 
         # Process gateway association
         if gateway_address:
-            self._process_gateway_association(
-                builder, gateway_address, route_table_node_name, resource_name, context
+            gateway_type = self._determine_gateway_type(gateway_address)
+            if not gateway_type:
+                logger.warning(
+                    "Unknown gateway type for '%s'. Association will be skipped.",
+                    gateway_address,
+                )
+                return
+
+            self._process_association(
+                builder,
+                gateway_address,
+                gateway_type,
+                route_table_node_name,
+                resource_name,
+                "gateway",
+                context,
             )
 
     def _extract_references(
@@ -186,12 +230,9 @@ class AWSRouteTableAssociationMapper(SingleResourceMapper):
                 logger.debug(f"Found subnet reference: {subnet_address}")
 
             # Check for gateway reference
-            elif prop_name == "gateway_id" and target_resource_type in [
-                "aws_internet_gateway",
-                "aws_egress_only_internet_gateway",
-                "aws_vpn_gateway",
-                "aws_nat_gateway",
-            ]:
+            elif (
+                prop_name == "gateway_id" and target_resource_type in _GATEWAY_TYPE_SET
+            ):
                 gateway_address = target_ref
                 logger.debug(f"Found gateway reference: {gateway_address}")
 
@@ -220,13 +261,7 @@ class AWSRouteTableAssociationMapper(SingleResourceMapper):
 
                 if gateway_id:
                     # Determine gateway type and find address
-                    gateway_types = [
-                        "aws_internet_gateway",
-                        "aws_egress_only_internet_gateway",
-                        "aws_vpn_gateway",
-                        "aws_nat_gateway",
-                    ]
-                    for gw_type in gateway_types:
+                    for gw_type in _GATEWAY_TYPES:
                         gw_address = self._find_terraform_address_by_aws_id(
                             context, gateway_id, gw_type
                         )
@@ -264,173 +299,70 @@ class AWSRouteTableAssociationMapper(SingleResourceMapper):
         Returns:
             Terraform address (e.g., 'aws_subnet.public') or None if not found
         """
-        # Look in state data for resources with matching AWS ID
-        state_data = context.parsed_data.get("state", {})
-        values = state_data.get("values", {})
-        if values:
-            root_module = values.get("root_module", {})
-            resources = root_module.get("resources", [])
-
-            for resource in resources:
-                if (
-                    resource.get("type") == resource_type
-                    and resource.get("values", {}).get("id") == aws_resource_id
-                ):
-                    return resource.get("address")
-
-        # Also check in planned_values (for plan JSON)
-        planned_values = context.parsed_data.get("planned_values", {})
-        if planned_values:
-            root_module = planned_values.get("root_module", {})
-            resources = root_module.get("resources", [])
-
-            for resource in resources:
-                if (
-                    resource.get("type") == resource_type
-                    and resource.get("values", {}).get("id") == aws_resource_id
-                ):
-                    return resource.get("address")
-
-        return None
-
-    def _process_subnet_association(
-        self,
-        builder: "ServiceTemplateBuilder",
-        subnet_address: str,
-        route_table_node_name: str,
-        resource_name: str,
-        context: "TerraformMappingContext | None" = None,
-    ) -> None:
-        """Process subnet to route table association.
-
-        Args:
-            builder: ServiceTemplateBuilder instance
-            subnet_address: Terraform address of the subnet
-            route_table_node_name: TOSCA name of the route table node
-            resource_name: Original resource name for logging
-        """
-        # Generate subnet TOSCA node name using context-aware logic
-        # If the address is already a TOSCA node name (no dot), use it directly
-        if "." in subnet_address:
-            # Terraform address format, need to convert to TOSCA node name
-            if context:
-                subnet_node_name = context.generate_tosca_node_name_from_address(
-                    subnet_address, "aws_subnet"
-                )
-            else:
-                subnet_node_name = BaseResourceMapper.generate_tosca_node_name(
-                    subnet_address, "aws_subnet"
-                )
-        else:
-            # Already a TOSCA node name
-            subnet_node_name = subnet_address
+        return context.find_resource_address_by_id(aws_resource_id, resource_type)
 
-        # Find the subnet node in the builder
-        subnet_node = self._find_node_in_builder(builder, subnet_node_name)
-        if not subnet_node:
-            logger.warning(
-                "Subnet node '%s' not found. The aws_subnet mapper may not "
-                "have run yet. Route table association for '%s' will be skipped.",
-                subnet_node_name,
-                resource_name,
-            )
-            return
-
-        # Check if route table node exists
-        route_table_node = self._find_node_in_builder(builder, route_table_node_name)
-        if not route_table_node:
-            logger.warning(
-                "Route table node '%s' not found. The aws_route_table mapper may not "
-                "have run yet. Route table association for '%s' will be skipped.",
-                route_table_node_name,
-                resource_name,
-            )
-            return
-
-        # Add the routing requirement to the subnet using DependsOn
-        self._add_routing_requirement(
-            subnet_node, route_table_node_name, "subnet", resource_name
-        )
-
-        logger.info(
-            "Successfully added route table association: %s -> %s (subnet)",
-            subnet_node_name,
-            route_table_node_name,
-        )
-
-    def _process_gateway_association(
+    def _process_association(
         self,
         builder: "ServiceTemplateBuilder",
-        gateway_address: str,
+        source_address: str,
+        source_type: str,
         route_table_node_name: str,
         resource_name: str,
+        association_type: str,
         context: "TerraformMappingContext | None" = None,
     ) -> None:
-        """Process gateway to route table association.
+        """Process subnet or gateway to route table association.
 
         Args:
             builder: ServiceTemplateBuilder instance
-            gateway_address: Terraform address of the gateway
-            route_table_node_name: TOSCA name of the route table node
+            source_address: Terraform address of the subnet or gateway
+            source_type: Terraform resource type of the source
+                (e.g. 'aws_subnet', 'aws_internet_gateway')
+            route_table_node_name: TOSCA name of the route table node, which
+                the caller has already found in the builder
             resource_name: Original resource name for logging
+            association_type: Type of association ('subnet' or 'gateway')
+            context: TerraformMappingContext for node name generation
         """
-        # Determine gateway type from address
-        gateway_type = self._determine_gateway_type(gateway_address)
-        if not gateway_type:
-            logger.warning(
-                "Unknown gateway type for '%s'. Association will be skipped.",
-                gateway_address,
-            )
-            return
-
-        # Generate gateway TOSCA node name using context-aware logic
+        # Generate source TOSCA node name using context-aware logic
         # If the address is already a TOSCA node name (no dot), use it directly
-        if "." in gateway_address:
+        if "." in source_address:
             # Terraform address format, need to convert to TOSCA node name
             if context:
-                gateway_node_name = context.generate_tosca_node_name_from_address(
-                    gateway_address, gateway_type
+                source_node_name = context.generate_tosca_node_name_from_address(
+                    source_address, source_type
                 )
             else:
-                gateway_node_name = BaseResourceMapper.generate_tosca_node_name(
-                    gateway_address, gateway_type
+                source_node_name = BaseResourceMapper.generate_tosca_node_name(
+                    source_address, source_type
                 )
         else:
             # Already a TOSCA node name
-            gateway_node_name = gateway_address
+            source_node_name = source_address
 
-        # Find the gateway node in the builder
-        gateway_node = self._find_node_in_builder(builder, gateway_node_name)
-        if not gateway_node:
+        # Find the source node in the builder
+        source_node = self._find_node_in_builder(builder, source_node_name)
+        if not source_node:
             logger.warning(
-                "Gateway node '%s' not found. The %s mapper may not "
+                "%s node '%s' not found. The %s mapper may not "
                 "have run yet. Route table association for '%s' will be skipped.",
-                gateway_node_name,
-                gateway_type,
+                association_type.capitalize(),
+                source_node_name,
+                source_type,
                 resource_name,
             )
             return
 
-        # Check if route table node exists
-        route_table_node = self._find_node_in_builder(builder, route_table_node_name)
-        if not route_table_node:
-            logger.warning(
-                "Route table node '%s' not found. The aws_route_table mapper may not "
-                "have run yet. Route table association for '%s' will be skipped.",
-                route_table_node_name,
-                resource_name,
-            )
-            return
-
-        # Add the routing requirement to the gateway
+        # Add the routing requirement to the source using DependsOn
         self._add_routing_requirement(
-            gateway_node, route_table_node_name, "gateway", resource_name
+            source_node, route_table_node_name, association_type, resource_name
         )
 
         logger.info(
-            "Successfully added route table association: %s -> %s (gateway)",
-            gateway_node_name,
+            "Successfully added route table association: %s -> %s (%s)",
+            source_node_name,
             route_table_node_name,
+            association_type,
         )
 
     def _determine_gateway_type(self, gateway_address: str) -> str | None:
@@ -442,16 +374,8 @@ class AWSRouteTableAssociationMapper(SingleResourceMapper):
         Returns:
             Gateway type string or None if unknown
         """
-        if "aws_internet_gateway" in gateway_address:
-            return "aws_internet_gateway"
-        elif "aws_egress_only_internet_gateway" in gateway_address:
-            return "aws_egress_only_internet_gateway"
-        elif "aws_vpn_gateway" in gateway_address:
-            return "aws_vpn_gateway"
-        elif "aws_nat_gateway" in gateway_address:
-            return "aws_nat_gateway"
-        else:
-            return None
+        match = _GATEWAY_TYPE_RE.search(gateway_address)
+        return match.group() if match else None
 
     def _find_node_in_builder(self, builder: "ServiceTemplateBuilder", node_name: str):
         """Find a node in the builder by name.
@@ -463,13 +387,8 @@ class AWSRouteTableAssociationMapper(SingleResourceMapper):
         Returns:
             The node object if found, None otherwise
         """
-        try:
-            # Use the get_node method
-            return builder.get_node(node_name)
-
-        except Exception as e:
-            logger.debug("Error while searching for node '%s': %s", node_name, e)
-            return None
+        # get_node already returns None for unknown names
+        return builder.get_node(node_name)
 
     def _add_routing_requirement(
         self,
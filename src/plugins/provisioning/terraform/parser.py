@@ -9,6 +9,13 @@ from typing import Any
 
 from src.core.common.base_parser import BaseSourceFileParser
 
+try:
+    # orjson, when installed, decodes multi-MB plan/state documents much
+    # faster; its JSONDecodeError subclasses json.JSONDecodeError
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -287,7 +294,7 @@ class TerraformParser(BaseSourceFileParser):
         result = self._run_command(cmd, terraform_dir, capture_output=True)
 
         try:
-            plan_data = json.loads(result.stdout)
+            plan_data = _json_loads(result.stdout)
             configuration = plan_data.get("configuration", {})
             root_module = configuration.get("root_module", {})
             variables = root_module.get("variables", {})
@@ -320,7 +327,7 @@ class TerraformParser(BaseSourceFileParser):
         result = self._run_command(cmd, terraform_dir, capture_output=True)
 
         try:
-            state_data = json.loads(result.stdout)
+            state_data = _json_loads(result.stdout)
             values = state_data.get("values", {})
             root_module = values.get("root_module", {})
             resources = root_module.get("resources", [])
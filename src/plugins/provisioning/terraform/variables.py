@@ -7,8 +7,16 @@ values with TOSCA get_input functions where appropriate.
 """
 
 import logging
+import re
+import reprlib
+import sys
+from collections import defaultdict, deque
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
-from typing import Any
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, Final
 
 from .exceptions import (
     OutputMappingError,
@@ -18,8 +26,41 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only default for dict.get() lookups on the plan JSON, so missing
+# keys do not allocate a fresh empty dict on every call
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Bracketed for_each instance keys in resource addresses, e.g.
+# aws_subnet.example["subnet1"]
+_MAP_KEY_RE: Final = re.compile(r'\["(.+?)"\]')
+
+# Child module path prefix of a resource address, e.g. module.net["a"].module.db.
+_MODULE_PATH_RE: Final = re.compile(r'(?:module\.[^.\[]+(?:\["[^"]*"\]|\[\d+\])?\.)+')
+
+# Contexts where values are always emitted concretely, never as $get_input
+_CONCRETE_VALUE_CONTEXTS: Final = frozenset({"metadata"})
+
+# Errors raised when the plan JSON does not have the expected shape (e.g. a
+# list where a mapping is expected, or None where a sequence is expected)
+_PLAN_SHAPE_ERRORS: Final = (AttributeError, TypeError)
+
+# Terraform type to TOSCA type mapping
+_TERRAFORM_TO_TOSCA_TYPE: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "string": "string",
+        "number": "float",  # Conservative choice - can handle both int and float
+        "bool": "boolean",
+        "list": "list",
+        "map": "map",
+        "set": "list",  # TOSCA doesn't have set, use list
+        # Complex types simplified to map
+        "object": "map",
+        "tuple": "list",
+    }
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class VariableDefinition:
     """Represents a Terraform variable definition."""
 
@@ -30,7 +71,7 @@ class VariableDefinition:
     sensitive: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ToscaInputDefinition:
     """Represents a TOSCA input parameter definition."""
 
@@ -42,7 +83,7 @@ class ToscaInputDefinition:
     entry_schema: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputDefinition:
     """Represents a Terraform output definition."""
 
@@ -53,7 +94,7 @@ class OutputDefinition:
     depends_on: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ToscaOutputDefinition:
     """Represents a TOSCA output parameter definition."""
 
@@ -62,24 +103,90 @@ class ToscaOutputDefinition:
     value: Any = None
 
 
+@dataclass(slots=True)
+class _PlanIndex:
+    """
+    Pre-resolved entry points into a Terraform plan.
+
+    Navigating ``plan.configuration.root_module`` and friends is done once here
+    so the extractors, tracker and output mapper can share the result instead
+    of repeating the same ``dict.get`` chains.
+    """
+
+    variables: Mapping[str, Any]
+    outputs: Mapping[str, Any]
+    resources: Sequence[dict[str, Any]]
+    planned_root: Mapping[str, Any]
+    planned_outputs: Mapping[str, Any]
+    state_outputs: Mapping[str, Any]
+
+    @classmethod
+    def from_parsed_data(cls, parsed_data: dict[str, Any]) -> "_PlanIndex":
+        """Build the index from the combined plan and state data."""
+        plan_data = parsed_data.get("plan", _EMPTY)
+        root_module = plan_data.get("configuration", _EMPTY).get("root_module", _EMPTY)
+        planned_root = plan_data.get("planned_values", _EMPTY).get(
+            "root_module", _EMPTY
+        )
+        state_root = (
+            parsed_data.get("state", _EMPTY)
+            .get("values", _EMPTY)
+            .get("root_module", _EMPTY)
+        )
+
+        return cls(
+            variables=root_module.get("variables", _EMPTY),
+            outputs=root_module.get("outputs", _EMPTY),
+            resources=root_module.get("resources", ()),
+            planned_root=planned_root,
+            planned_outputs=planned_root.get("outputs", _EMPTY),
+            state_outputs=state_root.get("outputs", _EMPTY),
+        )
+
+
+def _variable_definition_from_config(
+    var_name: str, var_config: dict[str, Any]
+) -> VariableDefinition:
+    """Build a VariableDefinition from a plan ``configuration`` variable block."""
+    return VariableDefinition(
+        name=var_name,
+        var_type=var_config.get("type"),
+        default=var_config.get("default"),
+        description=var_config.get("description"),
+        sensitive=var_config.get("sensitive", False),
+    )
+
+
+def _freeze(value: Any) -> Any:
+    """Return a hashable stand-in for a JSON value that compares like ``==``."""
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
 class VariableExtractor:
     """Extracts Terraform variables from plan JSON and converts to TOSCA inputs."""
 
+    # Complex Terraform type constructor -> (TOSCA type, typed entries). When
+    # entries are not typed the constructor's argument is a structural schema
+    # (object/tuple) and entries are simplified to strings.
+    _COMPLEX_PREFIX_MAP: Final[Mapping[str, tuple[str, bool]]] = MappingProxyType(
+        {
+            "list": ("list", True),
+            "map": ("map", True),
+            "set": ("list", True),  # TOSCA doesn't have set, use list
+            "object": ("map", False),
+            "tuple": ("list", False),
+        }
+    )
+
     def __init__(self):
         self._logger = logger.getChild(self.__class__.__name__)
-
-        # Terraform type to TOSCA type mapping
-        self._type_mapping = {
-            "string": "string",
-            "number": "float",  # Conservative choice - can handle both int and float
-            "bool": "boolean",
-            "list": "list",
-            "map": "map",
-            "set": "list",  # TOSCA doesn't have set, use list
-            # Complex types simplified to map
-            "object": "map",
-            "tuple": "list",
-        }
+        # Map: explicit Terraform type -> (TOSCA type, entry_schema); projects
+        # reuse a handful of type strings across all their variables
+        self._type_cache: dict[str, tuple[str, str | None]] = {}
 
     def extract_variables(
         self, parsed_data: dict[str, Any]
@@ -99,38 +206,99 @@ class VariableExtractor:
         if not isinstance(parsed_data, dict):
             raise ValidationError("parsed_data must be a dictionary")
 
-        self._logger.info("Extracting Terraform variables from plan")
+        try:
+            plan_index = _PlanIndex.from_parsed_data(parsed_data)
+        except _PLAN_SHAPE_ERRORS as e:
+            raise VariableExtractionError(f"Failed to extract variables: {e}") from e
+
+        return self.extract_variables_from_index(plan_index)
 
-        variables = {}
+    def extract_variables_from_index(
+        self, plan_index: _PlanIndex
+    ) -> dict[str, VariableDefinition]:
+        """
+        Extract all Terraform variables from a pre-built plan index.
+
+        Args:
+            plan_index: Plan index shared with the other variable components
+
+        Returns:
+            Dictionary mapping variable name to VariableDefinition
+        Raises:
+            VariableExtractionError: If variable extraction fails.
+        """
+        self._logger.info("Extracting Terraform variables from plan")
 
         try:
-            # Get plan data which contains variable definitions
-            plan_data = parsed_data.get("plan", {})
-            config = plan_data.get("configuration", {})
-            root_module = config.get("root_module", {})
-            terraform_vars = root_module.get("variables", {})
+            terraform_vars = plan_index.variables
+            # Parsed JSON only ever yields plain dicts
+            variables = {
+                var_name: _variable_definition_from_config(var_name, var_config)
+                for var_name, var_config in terraform_vars.items()
+                if type(var_config) is dict
+            }
+        except _PLAN_SHAPE_ERRORS as e:
+            raise VariableExtractionError(f"Failed to extract variables: {e}") from e
+
+        self._log_extracted_variables(terraform_vars, variables)
+        return variables
+
+    def extract_and_convert_from_index(
+        self, plan_index: _PlanIndex
+    ) -> tuple[dict[str, VariableDefinition], dict[str, ToscaInputDefinition]]:
+        """
+        Extract Terraform variables and their TOSCA inputs in a single pass.
 
+        Equivalent to extract_variables_from_index() followed by
+        convert_to_tosca_inputs(), without walking the variables twice.
+
+        Args:
+            plan_index: Plan index shared with the other variable components
+
+        Returns:
+            Tuple of (variable name -> VariableDefinition,
+            input name -> ToscaInputDefinition)
+        Raises:
+            VariableExtractionError: If variable extraction fails.
+        """
+        self._logger.info("Extracting Terraform variables and TOSCA inputs from plan")
+
+        variables: dict[str, VariableDefinition] = {}
+        tosca_inputs: dict[str, ToscaInputDefinition] = {}
+        to_tosca_input = self._to_tosca_input
+        try:
+            terraform_vars = plan_index.variables
             for var_name, var_config in terraform_vars.items():
-                if not isinstance(var_config, dict):
+                # Parsed JSON only ever yields plain dicts
+                if type(var_config) is dict:
+                    var_def = _variable_definition_from_config(var_name, var_config)
+                    variables[var_name] = var_def
+                    tosca_inputs[var_name] = to_tosca_input(var_name, var_def)
+        except _PLAN_SHAPE_ERRORS as e:
+            raise VariableExtractionError(f"Failed to extract variables: {e}") from e
+
+        self._log_extracted_variables(terraform_vars, variables)
+        self._logger.info("Converted %d variables to TOSCA inputs", len(tosca_inputs))
+        return variables, tosca_inputs
+
+    def _log_extracted_variables(
+        self,
+        terraform_vars: Mapping[str, Any],
+        variables: dict[str, VariableDefinition],
+    ) -> None:
+        """Report skipped variable configs and the extracted definitions."""
+        if len(variables) != len(terraform_vars):
+            for var_name in terraform_vars:
+                if var_name not in variables:
                     self._logger.warning(
-                        f"Skipping invalid variable config for '{var_name}'"
+                        "Skipping invalid variable config for '%s'", var_name
                     )
-                    continue
 
-                var_def = VariableDefinition(
-                    name=var_name,
-                    var_type=var_config.get("type"),
-                    default=var_config.get("default"),
-                    description=var_config.get("description"),
-                    sensitive=var_config.get("sensitive", False),
-                )
-                variables[var_name] = var_def
-                self._logger.debug(f"Extracted variable '{var_name}': {var_def}")
-        except Exception as e:
-            raise VariableExtractionError(f"Failed to extract variables: {e}") from e
+        if self._logger.isEnabledFor(logging.DEBUG):
+            for var_name, var_def in variables.items():
+                self._logger.debug("Extracted variable '%s': %s", var_name, var_def)
 
-        self._logger.info(f"Extracted {len(variables)} variables")
-        return variables
+        self._logger.info("Extracted %d variables", len(variables))
 
     def convert_to_tosca_inputs(
         self, variables: dict[str, VariableDefinition]
@@ -138,6 +306,8 @@ class VariableExtractor:
         """
         Convert Terraform variables to TOSCA input definitions.
 
+        Entries that are not VariableDefinition instances are skipped.
+
         Args:
             variables: Dictionary of Terraform variable definitions
 
@@ -151,36 +321,45 @@ class VariableExtractor:
 
         self._logger.info("Converting Terraform variables to TOSCA inputs")
 
-        tosca_inputs = {}
+        to_tosca_input = self._to_tosca_input
+        tosca_inputs = {
+            var_name: to_tosca_input(var_name, var_def)
+            for var_name, var_def in variables.items()
+            if isinstance(var_def, VariableDefinition)
+        }
 
-        for var_name, var_def in variables.items():
-            if not isinstance(var_def, VariableDefinition):
-                self._logger.warning(
-                    f"Skipping invalid variable definition for '{var_name}'"
-                )
-                continue
+        if len(tosca_inputs) != len(variables):
+            for var_name in variables:
+                if var_name not in tosca_inputs:
+                    self._logger.warning(
+                        "Skipping invalid variable definition for '%s'", var_name
+                    )
 
-            tosca_type, entry_schema = self._map_terraform_type_to_tosca(
-                var_def.var_type, var_def.default
-            )
-            required = var_def.default is None  # Required if no default value
-
-            tosca_input = ToscaInputDefinition(
-                name=var_name,
-                param_type=tosca_type,
-                description=var_def.description,
-                default=var_def.default,
-                required=required,
-                entry_schema=entry_schema,
-            )
-            tosca_inputs[var_name] = tosca_input
-            self._logger.debug(
-                f"Converted variable '{var_name}' to TOSCA input: {tosca_input}"
-            )
+        if self._logger.isEnabledFor(logging.DEBUG):
+            for var_name, tosca_input in tosca_inputs.items():
+                self._logger.debug(
+                    "Converted variable '%s' to TOSCA input: %s", var_name, tosca_input
+                )
 
-        self._logger.info(f"Converted {len(tosca_inputs)} variables to TOSCA inputs")
+        self._logger.info("Converted %d variables to TOSCA inputs", len(tosca_inputs))
         return tosca_inputs
 
+    def _to_tosca_input(
+        self, var_name: str, var_def: VariableDefinition
+    ) -> ToscaInputDefinition:
+        """Build the TOSCA input definition for a single Terraform variable."""
+        tosca_type, entry_schema = self._map_terraform_type_to_tosca(
+            var_def.var_type, var_def.default
+        )
+        return ToscaInputDefinition(
+            name=var_name,
+            param_type=tosca_type,
+            description=var_def.description,
+            default=var_def.default,
+            required=var_def.default is None,  # Required if no default value
+            entry_schema=entry_schema,
+        )
+
     def _map_terraform_type_to_tosca(
         self, terraform_type: str | None, default_value: Any = None
     ) -> tuple[str, str | None]:
@@ -202,33 +381,37 @@ class VariableExtractor:
                 return "list", "string"
             return "string", None  # Default fallback
 
+        cached = self._type_cache.get(terraform_type)
+        if cached is not None:
+            return cached
+
         # Handle simple types
-        if terraform_type in self._type_mapping:
-            return self._type_mapping[terraform_type], None
-
-        # Handle complex types like list(string), map(string), etc.
-        if terraform_type.startswith("list("):
-            # Extract entry type: list(string) -> string
-            entry_type = self._extract_entry_type(terraform_type)
-            return "list", entry_type
-        elif terraform_type.startswith("map("):
-            # Extract entry type: map(string) -> string
-            entry_type = self._extract_entry_type(terraform_type)
-            return "map", entry_type
-        elif terraform_type.startswith("set("):
-            # Extract entry type: set(string) -> string
-            entry_type = self._extract_entry_type(terraform_type)
-            return "list", entry_type  # TOSCA doesn't have set, use list
-        elif terraform_type.startswith("object("):
-            return "map", "string"  # Objects become maps with string entries
-        elif terraform_type.startswith("tuple("):
-            return "list", "string"  # Tuples become lists with string entries
-
-        # Fallback for unknown types
-        self._logger.warning(
-            f"Unknown Terraform type '{terraform_type}', using 'string' as fallback"
-        )
-        return "string", None
+        tosca_type = _TERRAFORM_TO_TOSCA_TYPE.get(terraform_type)
+        if tosca_type is not None:
+            mapping = tosca_type, None
+        else:
+            # Handle complex types like list(string), map(string), etc.
+            type_constructor, paren, _ = terraform_type.partition("(")
+            complex_mapping = (
+                self._COMPLEX_PREFIX_MAP.get(type_constructor) if paren else None
+            )
+            if complex_mapping is None:
+                # Fallback for unknown types; not cached so every use is reported
+                self._logger.warning(
+                    "Unknown Terraform type '%s', using 'string' as fallback",
+                    terraform_type,
+                )
+                return "string", None
+
+            tosca_type, typed_entries = complex_mapping
+            if typed_entries:
+                # Extract entry type: list(string) -> string
+                mapping = tosca_type, self._extract_entry_type(terraform_type)
+            else:
+                mapping = tosca_type, "string"
+
+        self._type_cache[terraform_type] = mapping
+        return mapping
 
     def _extract_entry_type(self, complex_type: str) -> str:
         """
@@ -240,16 +423,13 @@ class VariableExtractor:
         Returns:
             Entry type string
         """
-        import re
-
-        # Extract content between parentheses
-        match = re.match(r"\w+\((.+)\)", complex_type)
-        if match:
-            entry_type = match.group(1)
+        # Extract content between the first "(" and the last ")"
+        open_paren = complex_type.find("(")
+        close_paren = complex_type.rfind(")")
+        if 0 < open_paren < close_paren - 1:
+            entry_type = complex_type[open_paren + 1 : close_paren]
             # Map the entry type to TOSCA equivalent
-            if entry_type in self._type_mapping:
-                return self._type_mapping[entry_type]
-            return entry_type
+            return _TERRAFORM_TO_TOSCA_TYPE.get(entry_type, entry_type)
 
         # Fallback to string
         return "string"
@@ -273,67 +453,69 @@ class OutputExtractor:
         Returns:
             Dictionary mapping output name to OutputDefinition
         """
-        self._logger.info("Extracting Terraform outputs from plan")
+        try:
+            plan_index = _PlanIndex.from_parsed_data(parsed_data)
+        except _PLAN_SHAPE_ERRORS as e:
+            raise OutputMappingError(f"Failed to extract outputs: {e}") from e
+        return self.extract_outputs_from_index(plan_index)
 
-        outputs = {}
+    def extract_outputs_from_index(
+        self, plan_index: _PlanIndex
+    ) -> dict[str, OutputDefinition]:
+        """
+        Extract all Terraform outputs from a pre-built plan index.
 
-        # Get plan data which contains output definitions
-        plan_data = parsed_data.get("plan", {})
-        config = plan_data.get("configuration", {})
-        root_module = config.get("root_module", {})
-        terraform_outputs = root_module.get("outputs", {})
+        Args:
+            plan_index: Plan index shared with the other variable components
 
-        for output_name, output_config in terraform_outputs.items():
-            # Extract resolved value from planned_values if available
-            resolved_value = self._extract_resolved_output_value(
-                parsed_data, output_name
-            )
+        Returns:
+            Dictionary mapping output name to OutputDefinition
+        """
+        self._logger.info("Extracting Terraform outputs from plan")
 
-            output_def = OutputDefinition(
+        outputs = {
+            output_name: OutputDefinition(
                 name=output_name,
                 description=output_config.get("description"),
                 sensitive=output_config.get("sensitive", False),
-                value=resolved_value,
+                # Resolved value from planned_values or state if available
+                value=self._extract_resolved_output_value(plan_index, output_name),
                 depends_on=output_config.get("depends_on"),
             )
-            outputs[output_name] = output_def
-            self._logger.debug(f"Extracted output '{output_name}': {output_def}")
+            for output_name, output_config in plan_index.outputs.items()
+        }
+
+        if self._logger.isEnabledFor(logging.DEBUG):
+            for output_name, output_def in outputs.items():
+                self._logger.debug("Extracted output '%s': %s", output_name, output_def)
 
-        self._logger.info(f"Extracted {len(outputs)} outputs")
+        self._logger.info("Extracted %d outputs", len(outputs))
         return outputs
 
     def _extract_resolved_output_value(
-        self, parsed_data: dict[str, Any], output_name: str
+        self, plan_index: _PlanIndex, output_name: str
     ) -> Any:
         """
         Extract resolved output value from planned_values or state.
 
         Args:
-            parsed_data: The complete Terraform data
+            plan_index: Plan index shared with the other variable components
             output_name: Name of the output to extract
 
         Returns:
             The resolved value if available, None otherwise
         """
         # First try planned_values from plan data
-        plan_data = parsed_data.get("plan", {})
-        planned_values = plan_data.get("planned_values", {})
-        root_module_planned = planned_values.get("root_module", {})
-        if "outputs" in root_module_planned:
-            output_data = root_module_planned["outputs"].get(output_name, {})
-            if "value" in output_data:
-                return output_data["value"]
+        output_data = plan_index.planned_outputs.get(output_name, _EMPTY)
+        if "value" in output_data:
+            return output_data["value"]
 
         # Then try state data
-        state_data = parsed_data.get("state", {})
-        values = state_data.get("values", {})
-        root_module_state = values.get("root_module", {})
-        if "outputs" in root_module_state:
-            output_data = root_module_state["outputs"].get(output_name, {})
-            if "value" in output_data:
-                return output_data["value"]
-
-        self._logger.debug(f"No resolved value found for output '{output_name}'")
+        output_data = plan_index.state_outputs.get(output_name, _EMPTY)
+        if "value" in output_data:
+            return output_data["value"]
+
+        self._logger.debug("No resolved value found for output '%s'", output_name)
         return None
 
     def convert_to_tosca_outputs(
@@ -350,103 +532,77 @@ class OutputExtractor:
         """
         self._logger.info("Converting Terraform outputs to TOSCA outputs")
 
-        tosca_outputs = {}
-
-        for output_name, output_def in outputs.items():
-            # Skip sensitive outputs for security
-            if output_def.sensitive:
-                self._logger.debug(f"Skipping sensitive output '{output_name}'")
-                continue
-
-            # Skip outputs without resolved values (e.g., from plan-only scenarios)
-            if output_def.value is None:
-                self._logger.debug(
-                    f"Skipping output '{output_name}' - no resolved value available"
-                )
-                continue
-
-            tosca_output = ToscaOutputDefinition(
+        # Sensitive outputs are skipped for security, and outputs without a
+        # resolved value (e.g., from plan-only scenarios) have nothing to emit
+        tosca_outputs = {
+            output_name: ToscaOutputDefinition(
                 name=output_name,
                 description=output_def.description,
                 value=output_def.value,  # Will be processed later by mapping logic
             )
-            tosca_outputs[output_name] = tosca_output
-            self._logger.debug(
-                f"Converted output '{output_name}' to TOSCA output: {tosca_output}"
-            )
+            for output_name, output_def in outputs.items()
+            if not output_def.sensitive and output_def.value is not None
+        }
+
+        if self._logger.isEnabledFor(logging.DEBUG):
+            for output_name, output_def in outputs.items():
+                tosca_output = tosca_outputs.get(output_name)
+                if tosca_output is not None:
+                    self._logger.debug(
+                        "Converted output '%s' to TOSCA output: %s",
+                        output_name,
+                        tosca_output,
+                    )
+                elif output_def.sensitive:
+                    self._logger.debug("Skipping sensitive output '%s'", output_name)
+                else:
+                    self._logger.debug(
+                        "Skipping output '%s' - no resolved value available",
+                        output_name,
+                    )
 
-        self._logger.info(f"Converted {len(tosca_outputs)} outputs to TOSCA outputs")
+        self._logger.info("Converted %d outputs to TOSCA outputs", len(tosca_outputs))
         return tosca_outputs
 
 
 class OutputMapper:
     """Maps Terraform outputs to TOSCA outputs with intelligent attribute mapping."""
 
-    def __init__(self, parsed_data: dict[str, Any]):
-        self._logger = logger.getChild(self.__class__.__name__)
-        self.parsed_data = parsed_data
-
-        # Mapping of Terraform resource types to TOSCA node types and their attributes
-        self._resource_attribute_mapping = {
-            "aws_instance": {
-                "tosca_node_type": "Compute",
-                "attribute_mappings": {
-                    "private_ip": None,
-                    "public_ip": "public_address",
-                    "private_dns": None,  # Not available in Simple Profile
-                    "public_dns": None,  # Not available in Simple Profile
-                    "id": None,  # Not available in Simple Profile
-                    "arn": None,  # Not available in Simple Profile
-                },
-            },
-            "aws_vpc": {
-                "tosca_node_type": "Network",
-                "attribute_mappings": {
-                    "id": None,  # Not available in Simple Profile
-                    "arn": None,  # Not available in Simple Profile
-                    "cidr_block": "cidr",  # Maps to Network.cidr property
-                },
-            },
-            "aws_subnet": {
-                "tosca_node_type": "Network",
-                "attribute_mappings": {
-                    "id": None,
-                    "arn": None,
-                    "cidr_block": "cidr",
-                },
-            },
-            "aws_s3_bucket": {
-                "tosca_node_type": "Storage.ObjectStorage",
-                "attribute_mappings": {
-                    "id": None,
-                    "arn": None,
-                    "bucket": "name",  # Maps to ObjectStorage.name property
-                },
-            },
-            "aws_eip": {
-                "tosca_node_type": "Network",
-                "attribute_mappings": {
-                    "public_ip": None,  # Maps to Network address-related attribute
-                    "private_ip": None,  # Not available in Simple Profile
-                    "allocation_id": None,  # Not available in Simple Profile
-                    "id": None,  # Not available in Simple Profile
-                    "address": "network_address",  # Maps to Network address attribute
-                    "public_dns": None,  # Not available in Simple Profile
-                    "private_dns": None,  # Not available in Simple Profile
-                },
-            },
-            "aws_nat_gateway": {
-                "tosca_node_type": "Network",
-                "attribute_mappings": {
-                    # Maps to Network address-related attribute
-                    "public_ip": "network_address",
-                    "private_ip": None,  # Not available in Simple Profile
-                    "network_interface_id": None,  # Not available in Simple Profile
-                    "id": None,  # Not available in Simple Profile
-                },
-            },
+    # Map: (Terraform resource type, Terraform attribute) -> TOSCA attribute.
+    # Attributes without a Simple Profile equivalent (id, arn, private_ip,
+    # DNS names, ...) are intentionally absent and fall back to literal values.
+    _FLAT_ATTR_MAP: Final[Mapping[tuple[str, str], str]] = MappingProxyType(
+        {
+            ("aws_instance", "public_ip"): "public_address",  # Compute
+            ("aws_vpc", "cidr_block"): "cidr",  # Network.cidr property
+            ("aws_subnet", "cidr_block"): "cidr",  # Network.cidr property
+            ("aws_s3_bucket", "bucket"): "name",  # ObjectStorage.name property
+            ("aws_eip", "address"): "network_address",  # Network address attribute
+            ("aws_nat_gateway", "public_ip"): "network_address",
             # Add more resource types as needed
         }
+    )
+
+    def __init__(
+        self,
+        parsed_data: dict[str, Any],
+        plan_index: _PlanIndex | None = None,
+        resources_by_address: Mapping[str, dict[str, Any]] | None = None,
+    ):
+        self._logger = logger.getChild(self.__class__.__name__)
+        self.parsed_data = parsed_data
+        if plan_index is None:
+            try:
+                plan_index = _PlanIndex.from_parsed_data(parsed_data)
+            except _PLAN_SHAPE_ERRORS as e:
+                raise OutputMappingError(f"Failed to index outputs: {e}") from e
+        self._plan_index = plan_index
+        # Planned resources by address, used to resolve module-qualified refs
+        self._resources_by_address = resources_by_address or {}
+        self._output_configs = self._plan_index.outputs
+
+        # Map: output_name -> (resource_address, attribute_name)
+        self._ref_cache: dict[str, tuple[str | None, str | None]] = {}
 
     def map_output_value(
         self, output_def: OutputDefinition, tosca_nodes: dict[str, str]
@@ -473,43 +629,65 @@ class OutputMapper:
             return None
 
         try:
-            # Try to extract resource reference from output expression
-            resource_ref, attribute_name = self._extract_resource_reference(
-                output_def.name
-            )
-
-            if resource_ref and attribute_name:
-                # Check if we can map this to a TOSCA attribute
-                tosca_attribute = self._map_terraform_attribute_to_tosca(
-                    resource_ref, attribute_name
-                )
+            # Resource attribute this output can be expressed as, if any
+            attribute_reference = self._attribute_references.get(output_def.name)
 
-                if tosca_attribute and resource_ref in tosca_nodes:
+            if attribute_reference:
+                resource_ref, tosca_attribute = attribute_reference
+                if resource_ref in tosca_nodes:
                     tosca_node_name = tosca_nodes[resource_ref]
                     self._logger.debug(
-                        f"Mapping output '{output_def.name}' to get_attribute: "
-                        f"[{tosca_node_name}, {tosca_attribute}]"
+                        "Mapping output '%s' to get_attribute: [%s, %s]",
+                        output_def.name,
+                        tosca_node_name,
+                        tosca_attribute,
                     )
                     return {"$get_attribute": [tosca_node_name, tosca_attribute]}
-        except Exception as e:
+        except _PLAN_SHAPE_ERRORS as e:
             raise OutputMappingError(
                 f"Failed to map output '{output_def.name}': {e}"
             ) from e
 
         # Fallback to hardcoded value
         self._logger.debug(
-            f"Using hardcoded value for output '{output_def.name}': {output_def.value}"
+            "Using hardcoded value for output '%s': %s",
+            output_def.name,
+            output_def.value,
         )
         return output_def.value
 
-    # Note: lru_cache on methods can cause memory leaks but provides
-    # performance benefits for output reference extraction.
+    @cached_property
+    def _attribute_references(self) -> dict[str, tuple[str, str]]:
+        """
+        Map: output_name -> (resource_address, tosca_attribute).
+
+        Built in a single pass over the output configurations the first time an
+        output is mapped, so mapping a batch of outputs only has to look up the
+        TOSCA node name of each referenced resource.
+        """
+        attribute_references = {}
+        for output_name in self._output_configs:
+            resource_ref, attribute_name = self._extract_resource_reference(output_name)
+            if not (resource_ref and attribute_name):
+                continue
+
+            # Check if we can map this to a TOSCA attribute
+            tosca_attribute = self._map_terraform_attribute_to_tosca(
+                resource_ref, attribute_name
+            )
+            if tosca_attribute:
+                attribute_references[output_name] = (resource_ref, tosca_attribute)
+        return attribute_references
+
     def _extract_resource_reference(
         self, output_name: str
     ) -> tuple[str | None, str | None]:
         """
         Extract resource reference and attribute from Terraform output expression.
 
+        Results are memoized per output name for the lifetime of the mapper,
+        which is bound to a single parsed plan.
+
         Args:
             output_name: Name of the output definition
 
@@ -519,29 +697,41 @@ class OutputMapper:
         if not output_name:
             return None, None
 
+        cached = self._ref_cache.get(output_name)
+        if cached is None:
+            cached = self._find_resource_reference(output_name)
+            self._ref_cache[output_name] = cached
+        return cached
+
+    def _find_resource_reference(
+        self, output_name: str
+    ) -> tuple[str | None, str | None]:
+        """Scan an output expression for its first resource attribute reference."""
         try:
             # Look in configuration for output expressions
-            plan_data = self.parsed_data.get("plan", {})
-            config = plan_data.get("configuration", {})
-            root_module = config.get("root_module", {})
-            outputs = root_module.get("outputs", {})
-
-            output_config = outputs.get(output_name, {})
-            expression = output_config.get("expression", {})
+            output_config = self._output_configs.get(output_name, _EMPTY)
+            expression = output_config.get("expression", _EMPTY)
 
             # Check for direct resource attribute references
             if "references" in expression:
                 references = expression["references"]
-                # Use next() to find the first matching pattern
                 for ref in references:
-                    parts = ref.split(".")
-                    if len(parts) >= 3:  # resource_type.name.attribute
-                        resource_type, resource_name, attribute_name = parts[:3]
-                        resource_address = f"{resource_type}.{resource_name}"
+                    # Prefer an exact planned resource address, which also
+                    # covers module-qualified references
+                    resource_address, _, attribute_name = ref.rpartition(".")
+                    if resource_address in self._resources_by_address:
                         return resource_address, attribute_name
-        except Exception as e:
+
+                    # Stop splitting after resource_type.name; nested attribute
+                    # paths (e.g. "tags.Name") only contribute their first segment
+                    resource_type, _, rest = ref.partition(".")
+                    resource_name, sep, attribute_path = rest.partition(".")
+                    if sep:  # resource_type.name.attribute
+                        resource_address = f"{resource_type}.{resource_name}"
+                        return resource_address, attribute_path.partition(".")[0]
+        except _PLAN_SHAPE_ERRORS as e:
             self._logger.warning(
-                f"Error extracting reference for output '{output_name}': {e}"
+                "Error extracting reference for output '%s': %s", output_name, e
             )
 
         return None, None
@@ -559,27 +749,62 @@ class OutputMapper:
         Returns:
             TOSCA attribute name if mappable, None otherwise
         """
-        resource_type = resource_address.split(".")[0]
-        mapping = self._resource_attribute_mapping.get(resource_type, {})
-        attribute_mappings = mapping.get("attribute_mappings", {})
-        if not isinstance(attribute_mappings, dict):
-            return None
-
-        return attribute_mappings.get(terraform_attribute)
+        module_path = _MODULE_PATH_RE.match(resource_address)
+        if module_path:
+            resource_address = resource_address[module_path.end() :]
+        resource_type = resource_address.partition(".")[0]
+        return self._FLAT_ATTR_MAP.get((resource_type, terraform_attribute))
 
 
 class VariableReferenceTracker:
     """Tracks which resource properties reference Terraform variables."""
 
-    def __init__(self, parsed_data: dict[str, Any]):
+    __slots__ = (
+        "_logger",
+        "parsed_data",
+        "_plan_index",
+        "_known_variables",
+        "_variable_references",
+        "_resolved_values",
+        "_resources_by_address",
+        "_map_variable_references",
+        "_list_variable_references",
+        "_map_vars",
+        "_list_vars",
+        "_property_references",
+    )
+
+    def __init__(
+        self,
+        parsed_data: dict[str, Any],
+        plan_index: _PlanIndex | None = None,
+        known_variables: AbstractSet[str] | None = None,
+    ):
         self._logger = logger.getChild(self.__class__.__name__)
         self.parsed_data = parsed_data
 
-        # Map: (resource_address, property_name) -> variable_name
-        self._variable_references: dict[tuple[str, str], str] = {}
+        # Resolve the plan entry points once; every walk below reads from them
+        if plan_index is None:
+            try:
+                plan_index = _PlanIndex.from_parsed_data(parsed_data)
+            except _PLAN_SHAPE_ERRORS as e:
+                raise VariableExtractionError(
+                    f"Failed to build reference map: {e}"
+                ) from e
+        self._plan_index = plan_index
+
+        # Declared Terraform variable names, or None when not known upfront
+        self._known_variables = known_variables
+
+        # Map: resource_address -> property_name -> variable_name
+        self._variable_references: dict[str, dict[str, str]] = {}
+
+        # Map: resource_address -> property_name -> resolved_value
+        self._resolved_values: dict[str, dict[str, Any]] = {}
 
-        # Map: (resource_address, property_name) -> resolved_value
-        self._resolved_values: dict[tuple[str, str], Any] = {}
+        # Planned_values resources (root and child modules) keyed by their
+        # fully-qualified address
+        self._resources_by_address: dict[str, dict[str, Any]] = {}
 
         # Map: (resource_address, property_name) -> (variable_name, map_key)
         # For tracking map variable references like {$get_input: [var_name, key]}
@@ -590,90 +815,178 @@ class VariableReferenceTracker:
         self._list_variable_references: dict[tuple[str, str], tuple[str, int]] = {}
 
         self._build_reference_map()
+
+        # Build the variable definitions once and classify them for both
+        # pattern detectors; without resolved values there is nothing to match
+        if self._resolved_values:
+            terraform_variables = self._get_terraform_variables()
+        else:
+            self._logger.debug("No resolved values, skipping pattern detection")
+            terraform_variables = {}
+        self._map_vars: dict[str, VariableDefinition] = {
+            name: var_def
+            for name, var_def in terraform_variables.items()
+            if self._is_map_variable(var_def)
+        }
+        self._list_vars: dict[str, VariableDefinition] = {
+            name: var_def
+            for name, var_def in terraform_variables.items()
+            if self._is_list_variable(var_def)
+        }
+
         self._detect_map_variable_patterns()
         self._detect_list_variable_patterns()
 
+        # The reference maps are final from here on; fuse them into one
+        # (resource_address, property_name) -> (kind, variable_name, selector)
+        # index so lookups and resolution take a single probe. Later updates
+        # win, giving map references precedence over list and plain ones.
+        self._property_references: dict[tuple[str, str], tuple[str, str, Any]] = {
+            (resource_address, prop_name): ("var", var_name, None)
+            for resource_address, refs in self._variable_references.items()
+            for prop_name, var_name in refs.items()
+        }
+        for kind, references in (
+            ("list", self._list_variable_references),
+            ("map", self._map_variable_references),
+        ):
+            for key, (var_name, selector) in references.items():
+                self._property_references[key] = (kind, var_name, selector)
+
     def _build_reference_map(self):
         """Build the complete map of variable references and resolved values."""
         self._logger.info("Building variable reference map")
 
         try:
-            # Get configuration from plan data
-            plan_data = self.parsed_data.get("plan", {})
-            config = plan_data.get("configuration", {})
-            root_module = config.get("root_module", {})
-            resources = root_module.get("resources", [])
-
-            # Build reference map from configuration
-            for resource in resources:
-                resource_address = resource.get("address")
-                if not resource_address:
-                    continue
-
-                expressions = resource.get("expressions", {})
-                for prop_name, expr_data in expressions.items():
-                    if isinstance(expr_data, dict) and "references" in expr_data:
-                        references = expr_data["references"]
-                        # Use generator expression for more efficient processing
-                        var_refs = (
-                            ref for ref in references if ref and ref.startswith("var.")
-                        )
-
-                        for ref in var_refs:
-                            var_name = ref[4:]  # Remove "var." prefix
-                            key = (resource_address, prop_name)
-                            self._variable_references[key] = var_name
-                            self._logger.debug(
-                                "Found variable reference: %s.%s -> %s",
-                                resource_address,
-                                prop_name,
-                                var_name,
-                            )
-        except Exception as e:
+            if not self._plan_index.resources:
+                self._logger.debug("No configured resources, skipping reference scan")
+            elif self._known_variables is not None and not self._known_variables:
+                self._logger.debug("No variables declared, skipping reference scan")
+            else:
+                self._collect_variable_references()
+        except _PLAN_SHAPE_ERRORS as e:
             raise VariableExtractionError(f"Failed to build reference map: {e}") from e
 
         # Build resolved values map from plan data planned_values
-        plan_data = self.parsed_data.get("plan", {})
-        planned_values = plan_data.get("planned_values", {})
-        root_module_planned = planned_values.get("root_module", {})
-        self._extract_resolved_values(root_module_planned)
+        self._extract_resolved_values(self._plan_index.planned_root)
 
         self._logger.info(
             "Built reference map: %d variable references, %d resolved values",
-            len(self._variable_references),
-            len(self._resolved_values),
+            sum(map(len, self._variable_references.values())),
+            sum(map(len, self._resolved_values.values())),
         )
 
+    def _collect_variable_references(self):
+        """Record var.* references made by the configuration resources."""
+        variable_references = self._variable_references
+        log_debug = self._logger.debug
+        debug_enabled = self._logger.isEnabledFor(logging.DEBUG)
+
+        for resource_address, prop_name, var_name in self._iter_variable_references():
+            variable_references.setdefault(resource_address, {})[prop_name] = var_name
+            if debug_enabled:
+                log_debug(
+                    "Found variable reference: %s.%s -> %s",
+                    resource_address,
+                    prop_name,
+                    var_name,
+                )
+
+    def _iter_variable_references(self) -> Iterator[tuple[str, str, str]]:
+        """
+        Yield interned (resource_address, property_name, variable_name) triples.
+
+        Only references to declared variables are yielded when the declared
+        names are known.
+        """
+        known_variables = self._known_variables
+
+        for resource in self._plan_index.resources:
+            resource_address = resource.get("address")
+            expressions = resource.get("expressions")
+            if not resource_address or not expressions:
+                continue
+            resource_address = sys.intern(resource_address)
+
+            for prop_name, expr_data in expressions.items():
+                # Parsed JSON only ever yields plain dicts
+                references = (
+                    expr_data.get("references") if type(expr_data) is dict else None
+                )
+                if not references:
+                    continue
+                for ref in references:
+                    if not ref or not ref.startswith("var."):
+                        continue  # Not a variable reference
+                    var_name = ref[4:]
+                    if known_variables is not None and var_name not in known_variables:
+                        continue  # Not a declared variable (e.g. var.obj.attr)
+
+                    yield resource_address, sys.intern(prop_name), sys.intern(var_name)
+
     def _detect_map_variable_patterns(self):
         """Detect patterns where properties should use map variable references."""
         self._logger.info("Detecting map variable patterns")
 
-        # Get the terraform variables to check for map types
-        terraform_variables = self._get_terraform_variables()
-        map_variables = {
-            name: var_def
-            for name, var_def in terraform_variables.items()
-            if self._is_map_variable(var_def)
-        }
+        map_variables = self._map_vars
 
         if not map_variables:
             self._logger.debug("No map variables found, skipping pattern detection")
             return
 
+        # Reverse index of every map variable entry: value -> {var_name: key},
+        # in declaration order, so each resolved value is a single lookup
+        value_index: dict[Any, dict[str, str]] = {}
+        var_positions: dict[str, int] = {}
+        for position, (var_name, var_def) in enumerate(map_variables.items()):
+            var_positions[var_name] = position
+            if not isinstance(var_def.default, dict):
+                continue
+            for map_key, value in var_def.default.items():
+                if not map_key:
+                    continue
+                try:
+                    entries = value_index.setdefault(value, {})
+                except TypeError:
+                    # Lists/dicts are keyed by their frozen (hashable) form
+                    entries = value_index.setdefault(_freeze(value), {})
+                entries.setdefault(var_name, map_key)
+
+        # Value and address matches both need a populated default
+        if not value_index:
+            self._logger.debug(
+                "No map variable entries found, skipping pattern detection"
+            )
+            return
+
+        # Address-based matches only depend on the resource address
+        address_matches: dict[str, tuple[str, str] | None] = {}
+        map_references = self._map_variable_references
+        debug_enabled = self._logger.isEnabledFor(logging.DEBUG)
+
         # Analyze resolved values to find patterns matching map variable values
-        for (
-            resource_address,
-            prop_name,
-        ), resolved_value in self._resolved_values.items():
-            # Check if this value matches any map variable entry
-            for var_name, var_def in map_variables.items():
-                map_key = self._find_matching_map_key(
-                    resolved_value, var_def.default, resource_address
+        for resource_address, prop_name, resolved_value in self._iter_resolved_values():
+            match = self._match_indexed_value(resolved_value, value_index)
+
+            if resource_address not in address_matches:
+                address_matches[resource_address] = self._match_map_address(
+                    resource_address, map_variables
                 )
-                if map_key:
-                    # Found a match - this property should use get_input
-                    key = (resource_address, prop_name)
-                    self._map_variable_references[key] = (var_name, map_key)
+            address_match = address_matches[resource_address]
+
+            # Only match the first declared variable to avoid conflicts,
+            # whether it matched by value or by the key in the address
+            if address_match and (
+                match is None
+                or var_positions[address_match[0]] < var_positions[match[0]]
+            ):
+                match = address_match
+
+            if match:
+                # Found a match - this property should use get_input
+                map_references[(resource_address, prop_name)] = match
+                if debug_enabled:
+                    var_name, map_key = match
                     self._logger.debug(
                         "Detected map variable pattern: %s.%s -> "
                         "{$get_input: [%s, %s]}",
@@ -682,7 +995,6 @@ class VariableReferenceTracker:
                         var_name,
                         map_key,
                     )
-                    break  # Only match the first variable to avoid conflicts
 
         self._logger.info(
             "Detected %d map variable references", len(self._map_variable_references)
@@ -692,32 +1004,63 @@ class VariableReferenceTracker:
         """Detect patterns where properties should use list variable references."""
         self._logger.info("Detecting list variable patterns")
 
-        # Get the terraform variables to check for list types
-        terraform_variables = self._get_terraform_variables()
-        list_variables = {
-            name: var_def
-            for name, var_def in terraform_variables.items()
-            if self._is_list_variable(var_def)
-        }
+        list_variables = self._list_vars
 
         if not list_variables:
             self._logger.debug("No list variables found, skipping pattern detection")
             return
 
+        # Reverse index of every list variable element: value -> {var_name: index},
+        # keeping the first index per variable as list.index() would
+        value_index: dict[Any, dict[str, int]] = {}
+        var_positions: dict[str, int] = {}
+        for position, (var_name, var_def) in enumerate(list_variables.items()):
+            var_positions[var_name] = position
+            if not isinstance(var_def.default, list):
+                continue
+            for list_index, value in enumerate(var_def.default):
+                try:
+                    entries = value_index.setdefault(value, {})
+                except TypeError:
+                    # Lists/dicts are keyed by their frozen (hashable) form
+                    entries = value_index.setdefault(_freeze(value), {})
+                entries.setdefault(var_name, list_index)
+
+        # Value and address matches both need a populated default
+        if not value_index:
+            self._logger.debug(
+                "No list variable elements found, skipping pattern detection"
+            )
+            return
+
+        # Address-based matches only depend on the resource address
+        address_matches: dict[str, tuple[str, int] | None] = {}
+        list_references = self._list_variable_references
+        debug_enabled = self._logger.isEnabledFor(logging.DEBUG)
+
         # Analyze resolved values to find patterns matching list variable values
-        for (
-            resource_address,
-            prop_name,
-        ), resolved_value in self._resolved_values.items():
-            # Check if this value matches any list variable entry
-            for var_name, var_def in list_variables.items():
-                list_index = self._find_matching_list_index(
-                    resolved_value, var_def.default, resource_address
+        for resource_address, prop_name, resolved_value in self._iter_resolved_values():
+            match = self._match_indexed_value(resolved_value, value_index)
+
+            if resource_address not in address_matches:
+                address_matches[resource_address] = self._match_list_address(
+                    resource_address, list_variables
                 )
-                if list_index is not None:
-                    # Found a match - this property should use get_input
-                    key = (resource_address, prop_name)
-                    self._list_variable_references[key] = (var_name, list_index)
+            address_match = address_matches[resource_address]
+
+            # Only match the first declared variable to avoid conflicts,
+            # whether it matched by value or by the index in the address
+            if address_match and (
+                match is None
+                or var_positions[address_match[0]] < var_positions[match[0]]
+            ):
+                match = address_match
+
+            if match:
+                # Found a match - this property should use get_input
+                list_references[(resource_address, prop_name)] = match
+                if debug_enabled:
+                    var_name, list_index = match
                     self._logger.debug(
                         "Detected list variable pattern: %s.%s -> "
                         "{$get_input: [%s, %d]}",
@@ -726,7 +1069,6 @@ class VariableReferenceTracker:
                         var_name,
                         list_index,
                     )
-                    break  # Only match the first variable to avoid conflicts
 
         self._logger.info(
             "Detected %d list variable references", len(self._list_variable_references)
@@ -735,25 +1077,13 @@ class VariableReferenceTracker:
     def _get_terraform_variables(self) -> dict[str, VariableDefinition]:
         """Get terraform variables from the parsed data."""
         try:
-            plan_data = self.parsed_data.get("plan", {})
-            config = plan_data.get("configuration", {})
-            root_module = config.get("root_module", {})
-            terraform_vars = root_module.get("variables", {})
-
-            variables = {}
-            for var_name, var_config in terraform_vars.items():
-                if isinstance(var_config, dict):
-                    var_def = VariableDefinition(
-                        name=var_name,
-                        var_type=var_config.get("type"),
-                        default=var_config.get("default"),
-                        description=var_config.get("description"),
-                        sensitive=var_config.get("sensitive", False),
-                    )
-                    variables[var_name] = var_def
-            return variables
-        except Exception as e:
-            self._logger.warning(f"Failed to get terraform variables: {e}")
+            return {
+                var_name: _variable_definition_from_config(var_name, var_config)
+                for var_name, var_config in self._plan_index.variables.items()
+                if type(var_config) is dict
+            }
+        except _PLAN_SHAPE_ERRORS as e:
+            self._logger.warning("Failed to get terraform variables: %s", e)
             return {}
 
     def _is_map_variable(self, var_def: VariableDefinition) -> bool:
@@ -763,8 +1093,9 @@ class VariableReferenceTracker:
             return True
 
         # Then check explicit type if available
-        if var_def.var_type:
-            var_type = var_def.var_type.lower()
+        # Terraform always emits type constraints in lowercase
+        var_type = var_def.var_type
+        if var_type:
             return var_type == "map" or var_type.startswith("map(")
 
         # If no explicit type and default is not a dict, not a map
@@ -777,106 +1108,122 @@ class VariableReferenceTracker:
             return True
 
         # Then check explicit type if available
-        if var_def.var_type:
-            var_type = var_def.var_type.lower()
+        # Terraform always emits type constraints in lowercase
+        var_type = var_def.var_type
+        if var_type:
             return var_type == "list" or var_type.startswith("list(")
 
         # If no explicit type and default is not a list, not a list
         return False
 
-    def _find_matching_map_key(
-        self, resolved_value: Any, map_default: dict | None, resource_address: str
-    ) -> str | None:
-        """Find which map key corresponds to a resolved value."""
-        if not isinstance(map_default, dict):
-            return None
+    def _match_indexed_value(
+        self, resolved_value: Any, value_index: dict[Any, dict[str, Any]]
+    ) -> tuple[str, Any] | None:
+        """Find the first (variable_name, key) whose value equals resolved_value."""
+        try:
+            matches = value_index.get(resolved_value)
+        except TypeError:
+            # Lists/dicts are indexed by their frozen form
+            matches = value_index.get(_freeze(resolved_value))
 
-        # First try direct value matching
-        for key, value in map_default.items():
-            if value == resolved_value:
-                return key
+        if matches:
+            return next(iter(matches.items()))
+        return None
 
-        # If no direct match, try to infer from resource address
+    def _match_map_address(
+        self, resource_address: str, map_variables: dict[str, VariableDefinition]
+    ) -> tuple[str, str] | None:
+        """Infer (variable_name, map_key) from a keyed resource address."""
         # For resources like aws_subnet.example["subnet1"], extract "subnet1"
-        if "[" in resource_address and "]" in resource_address:
-            import re
-
-            match = re.search(r'\["(.+?)"\]', resource_address)
+        if "]" in resource_address:
+            match = _MAP_KEY_RE.search(resource_address)
             if match:
                 potential_key = match.group(1)
-                if potential_key in map_default:
-                    return potential_key
+                for var_name, var_def in map_variables.items():
+                    map_default = var_def.default
+                    if isinstance(map_default, dict) and potential_key in map_default:
+                        return var_name, potential_key
 
         return None
 
-    def _find_matching_list_index(
-        self, resolved_value: Any, list_default: list | None, resource_address: str
-    ) -> int | None:
-        """Find which list index corresponds to a resolved value."""
-        if not isinstance(list_default, list):
+    def _match_list_address(
+        self, resource_address: str, list_variables: dict[str, VariableDefinition]
+    ) -> tuple[str, int] | None:
+        """Infer (variable_name, list_index) from an indexed resource address."""
+        # For resources like aws_subnet.example[0], extract index 0. The last
+        # bracket pair is the resource's own; earlier ones belong to modules.
+        open_bracket = resource_address.rfind("[")
+        close_bracket = resource_address.find("]", open_bracket + 1)
+        if open_bracket < 0 or close_bracket < 0:
+            return None
+        # Accept both integers and quoted integers in brackets
+        inner = resource_address[open_bracket + 1 : close_bracket].strip("\"'")
+        if not inner.isdecimal():
             return None
 
-        # First try direct value matching
-        try:
-            return list_default.index(resolved_value)
-        except (ValueError, TypeError):
-            pass
-
-        # If no direct match, try to infer from resource address
-        # For resources like aws_subnet.example[0], extract index 0
-        if "[" in resource_address and "]" in resource_address:
-            import re
-
-            # Match both quoted strings and integers in brackets
-            match = re.search(r'\[(["\']?(\d+)["\']?)\]', resource_address)
-            if match:
-                try:
-                    index = int(match.group(2))
-                    if 0 <= index < len(list_default):
-                        return index
-                except (ValueError, IndexError):
-                    pass
+        index = int(inner)
+        for var_name, var_def in list_variables.items():
+            list_default = var_def.default
+            if isinstance(list_default, list) and index < len(list_default):
+                return var_name, index
 
         return None
 
     def _extract_resolved_values(
         self, module_data: dict[str, Any], module_prefix: str = ""
     ):
-        """Recursively extract resolved values from planned_values."""
-        resources = module_data.get("resources", [])
+        """
+        Extract resolved values from planned_values, including child modules.
+
+        The module tree is walked iteratively with an explicit work list so that
+        deeply nested module hierarchies do not hit the recursion limit.
+        """
+        stack = deque([(module_data, module_prefix)])
+        while stack:
+            current_module, prefix = stack.pop()
+
+            for resource in current_module.get("resources", ()):
+                resource_address = resource.get("address", "")
+                # Terraform already qualifies child-module resource addresses
+                if prefix and not resource_address.startswith(f"{prefix}."):
+                    resource_address = f"{prefix}.{resource_address}"
+                resource_address = sys.intern(resource_address)
+
+                self._resources_by_address[resource_address] = resource
 
-        for resource in resources:
-            resource_address = resource.get("address", "")
-            if module_prefix:
-                resource_address = f"{module_prefix}.{resource_address}"
+                values = resource.get("values", _EMPTY)
+                self._resolved_values.setdefault(resource_address, {}).update(values)
 
-            values = resource.get("values", {})
-            for prop_name, value in values.items():
-                key = (resource_address, prop_name)
-                self._resolved_values[key] = value
+            for child_module in current_module.get("child_modules", ()):
+                stack.append((child_module, child_module.get("address", "")))
 
-        # Recurse into child modules
-        for child_module in module_data.get("child_modules", []):
-            child_address = child_module.get("address", "")
-            self._extract_resolved_values(child_module, child_address)
+    def _iter_resolved_values(self):
+        """Yield (resource_address, property_name, resolved_value) triples.
+
+        Only root module resources are yielded: child modules receive their own
+        inputs, so a value equal to a root variable entry is not a reference.
+        """
+        for resource_address, props in self._resolved_values.items():
+            if resource_address.startswith("module."):
+                continue
+            for prop_name, resolved_value in props.items():
+                yield resource_address, prop_name, resolved_value
 
     def is_variable_reference(self, resource_address: str, property_name: str) -> bool:
         """Check if a resource property references a variable."""
-        key = (resource_address, property_name)
-        return (
-            key in self._variable_references
-            or key in self._map_variable_references
-            or key in self._list_variable_references
-        )
+        return (resource_address, property_name) in self._property_references
 
     def get_variable_name(
         self, resource_address: str, property_name: str
     ) -> str | None:
         """Get the variable name referenced by a resource property."""
-        key = (resource_address, property_name)
         # Check regular variable references first
-        if key in self._variable_references:
-            return self._variable_references[key]
+        var_name = self._variable_references.get(resource_address, _EMPTY).get(
+            property_name
+        )
+        if var_name is not None:
+            return var_name
+        key = (resource_address, property_name)
         # Check map variable references
         if key in self._map_variable_references:
             var_name, _ = self._map_variable_references[key]
@@ -887,10 +1234,21 @@ class VariableReferenceTracker:
             return var_name
         return None
 
+    def get_planned_resource(self, resource_address: str) -> dict[str, Any] | None:
+        """Get the planned_values entry for a fully-qualified resource address."""
+        return self._resources_by_address.get(resource_address)
+
+    def get_all_planned_resources(self) -> dict[str, dict[str, Any]]:
+        """Get all planned_values resources keyed by fully-qualified address."""
+        return self._resources_by_address
+
     def get_resolved_value(self, resource_address: str, property_name: str) -> Any:
         """Get the resolved (concrete) value for a resource property."""
-        key = (resource_address, property_name)
-        return self._resolved_values.get(key)
+        return self._resolved_values.get(resource_address, _EMPTY).get(property_name)
+
+    def get_resolved_values(self, resource_address: str) -> Mapping[str, Any]:
+        """Get all resolved (concrete) values of a resource, keyed by property."""
+        return self._resolved_values.get(resource_address, _EMPTY)
 
     def should_use_get_input(
         self, resource_address: str, property_name: str, context: str = "property"
@@ -907,11 +1265,11 @@ class VariableReferenceTracker:
             True if should use $get_input, False if should use concrete value
         """
         # IMPORTANT EXCEPTION: Never use $get_input in metadata
-        if context == "metadata":
+        if context in _CONCRETE_VALUE_CONTEXTS:
             return False
 
         # Use $get_input if this property references a variable
-        return self.is_variable_reference(resource_address, property_name)
+        return (resource_address, property_name) in self._property_references
 
     def get_map_variable_reference(
         self, resource_address: str, property_name: str
@@ -927,24 +1285,59 @@ class VariableReferenceTracker:
         key = (resource_address, property_name)
         return self._list_variable_references.get(key)
 
-    def get_all_variable_references(self) -> dict[tuple[str, str], str]:
-        """Get all variable references for debugging/logging."""
-        return self._variable_references.copy()
+    def get_property_reference(
+        self, resource_address: str, property_name: str
+    ) -> tuple[str, str, Any] | None:
+        """
+        Get the variable reference that should be used for a property.
+
+        Returns:
+            (kind, variable_name, selector) where kind is "map" (selector is the
+            map key), "list" (selector is the index) or "var" (selector is
+            None), or None if the property does not reference a variable
+        """
+        return self._property_references.get((resource_address, property_name))
+
+    def get_all_variable_references(self) -> Mapping[str, Mapping[str, str]]:
+        """
+        Get all variable references for debugging/logging.
+
+        Returns:
+            Read-only view mapping resource address to a mapping of
+            property name -> variable name. The view is live, not a copy.
+        """
+        return MappingProxyType(self._variable_references)
 
-    def get_all_map_variable_references(self) -> dict[tuple[str, str], tuple[str, str]]:
-        """Get all map variable references for debugging/logging."""
-        return self._map_variable_references.copy()
+    def get_all_map_variable_references(
+        self,
+    ) -> Mapping[tuple[str, str], tuple[str, str]]:
+        """
+        Get all map variable references for debugging/logging.
+
+        Returns:
+            Read-only live view mapping (resource address, property name) to
+            (variable name, map key)
+        """
+        return MappingProxyType(self._map_variable_references)
 
     def get_all_list_variable_references(
         self,
-    ) -> dict[tuple[str, str], tuple[str, int]]:
-        """Get all list variable references for debugging/logging."""
-        return self._list_variable_references.copy()
+    ) -> Mapping[tuple[str, str], tuple[str, int]]:
+        """
+        Get all list variable references for debugging/logging.
+
+        Returns:
+            Read-only live view mapping (resource address, property name) to
+            (variable name, list index)
+        """
+        return MappingProxyType(self._list_variable_references)
 
 
 class PropertyResolver:
     """Resolves property values based on variable context."""
 
+    __slots__ = ("_logger", "variable_tracker")
+
     def __init__(self, variable_tracker: VariableReferenceTracker):
         self._logger = logger.getChild(self.__class__.__name__)
         self.variable_tracker = variable_tracker
@@ -965,66 +1358,99 @@ class PropertyResolver:
         Returns:
             Either {"$get_input": "variable_name"} or the concrete resolved value
         """
-        should_use_get_input = self.variable_tracker.should_use_get_input(
-            resource_address, property_name, context
-        )
+        debug_enabled = self._logger.isEnabledFor(logging.DEBUG)
 
-        if should_use_get_input:
-            # Check for map variable references first
-            map_var_ref = self.variable_tracker.get_map_variable_reference(
+        # Never use $get_input in metadata (see should_use_get_input)
+        reference = (
+            None
+            if context in _CONCRETE_VALUE_CONTEXTS
+            else self.variable_tracker.get_property_reference(
                 resource_address, property_name
             )
-            if map_var_ref:
-                var_name, map_key = map_var_ref
-                self._logger.debug(
-                    "Using $get_input for %s.%s -> [%s, %s]",
-                    resource_address,
-                    property_name,
-                    var_name,
-                    map_key,
-                )
-                return {"$get_input": [var_name, map_key]}
+        )
 
-            # Check for list variable references
-            list_var_ref = self.variable_tracker.get_list_variable_reference(
-                resource_address, property_name
-            )
-            if list_var_ref:
-                var_name, list_index = list_var_ref
-                self._logger.debug(
-                    "Using $get_input for %s.%s -> [%s, %d]",
-                    resource_address,
-                    property_name,
-                    var_name,
-                    list_index,
-                )
-                return {"$get_input": [var_name, list_index]}
+        if reference is not None:
+            # Map references take precedence over list and plain references
+            kind, var_name, selector = reference
+            if kind == "var":
+                if debug_enabled:
+                    self._logger.debug(
+                        "Using $get_input for %s.%s -> %s",
+                        resource_address,
+                        property_name,
+                        var_name,
+                    )
+                return {"$get_input": var_name}
 
-            # Check for regular variable references
-            regular_var_name = self.variable_tracker.get_variable_name(
-                resource_address, property_name
-            )
-            if regular_var_name:
+            if debug_enabled:
                 self._logger.debug(
-                    "Using $get_input for %s.%s -> %s",
+                    "Using $get_input for %s.%s -> [%s, %s]",
                     resource_address,
                     property_name,
-                    regular_var_name,
+                    var_name,
+                    selector,
                 )
-                return {"$get_input": regular_var_name}
+            return {"$get_input": [var_name, selector]}
 
         # Fall back to concrete resolved value
         resolved_value = self.variable_tracker.get_resolved_value(
             resource_address, property_name
         )
-        self._logger.debug(
-            "Using concrete value for %s.%s -> %s",
-            resource_address,
-            property_name,
-            resolved_value,
-        )
+        if debug_enabled:
+            # Truncated repr: resolved values can be large nested structures
+            self._logger.debug(
+                "Using concrete value for %s.%s -> %s",
+                resource_address,
+                property_name,
+                reprlib.repr(resolved_value),
+            )
         return resolved_value
 
+    def resolve_property_values(
+        self,
+        resource_address: str,
+        property_names: Iterable[str],
+        context: str = "property",
+    ) -> dict[str, Any]:
+        """
+        Resolve several properties of one resource at once.
+
+        Equivalent to calling resolve_property_value() for each property name,
+        but the resource's resolved values are looked up only once.
+
+        Args:
+            resource_address: Resource address (e.g., "aws_instance.web")
+            property_names: Property names to resolve
+            context: Context where values will be used
+                ("property", "metadata", "attribute")
+
+        Returns:
+            Dictionary mapping each property name to either a $get_input
+            function or its concrete resolved value
+        """
+        resolved_values = self.variable_tracker.get_resolved_values(resource_address)
+
+        # Never use $get_input in metadata (see should_use_get_input)
+        if context in _CONCRETE_VALUE_CONTEXTS:
+            return {name: resolved_values.get(name) for name in property_names}
+
+        get_reference = self.variable_tracker.get_property_reference
+        results: dict[str, Any] = {}
+        for name in property_names:
+            reference = get_reference(resource_address, name)
+            if reference is None:
+                results[name] = resolved_values.get(name)
+            elif reference[0] == "var":
+                results[name] = {"$get_input": reference[1]}
+            else:
+                results[name] = {"$get_input": [reference[1], reference[2]]}
+
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "Resolved %d properties for %s", len(results), resource_address
+            )
+        return results
+
 
 class VariableContext:
     """
@@ -1038,36 +1464,62 @@ class VariableContext:
         self._logger = logger.getChild(self.__class__.__name__)
         self.parsed_data = parsed_data
 
-        # Initialize components
+        # Navigate the plan once and share the result with every component
+        try:
+            plan_index = _PlanIndex.from_parsed_data(parsed_data)
+        except _PLAN_SHAPE_ERRORS as e:
+            raise VariableExtractionError(f"Failed to build reference map: {e}") from e
+        self._plan_index = plan_index
+
+        # Initialize components. Variables are extracted first so the tracker
+        # can skip its reference scan entirely when none are declared.
         self.extractor = VariableExtractor()
-        self.reference_tracker = VariableReferenceTracker(parsed_data)
+        self.reference_tracker = VariableReferenceTracker(
+            parsed_data, plan_index, known_variables=self.terraform_variables.keys()
+        )
         self.property_resolver = PropertyResolver(self.reference_tracker)
 
         # Initialize output components
         self.output_extractor = OutputExtractor()
-        self.output_mapper = OutputMapper(parsed_data)
-
-        # Extract variables and convert to TOSCA inputs
-        self.terraform_variables = self.extractor.extract_variables(parsed_data)
-        self.tosca_inputs = self.extractor.convert_to_tosca_inputs(
-            self.terraform_variables
-        )
-
-        # Extract outputs and convert to TOSCA outputs
-        self.terraform_outputs = self.output_extractor.extract_outputs(parsed_data)
-        self.tosca_outputs = self.output_extractor.convert_to_tosca_outputs(
-            self.terraform_outputs
+        self.output_mapper = OutputMapper(
+            parsed_data,
+            plan_index,
+            self.reference_tracker.get_all_planned_resources(),
         )
 
         self._logger.info(
-            "Initialized VariableContext with %d variables, %d TOSCA inputs, "
-            "%d outputs, %d TOSCA outputs",
+            "Initialized VariableContext with %d variables; outputs are "
+            "extracted on first use",
             len(self.terraform_variables),
-            len(self.tosca_inputs),
-            len(self.terraform_outputs),
-            len(self.tosca_outputs),
         )
 
+    @cached_property
+    def _variables_and_inputs(
+        self,
+    ) -> tuple[dict[str, VariableDefinition], dict[str, ToscaInputDefinition]]:
+        """Variable definitions and their TOSCA inputs, built in one pass."""
+        return self.extractor.extract_and_convert_from_index(self._plan_index)
+
+    @cached_property
+    def terraform_variables(self) -> dict[str, VariableDefinition]:
+        """Terraform variable definitions, extracted on first access."""
+        return self._variables_and_inputs[0]
+
+    @cached_property
+    def tosca_inputs(self) -> dict[str, ToscaInputDefinition]:
+        """TOSCA input definitions converted from the Terraform variables."""
+        return self._variables_and_inputs[1]
+
+    @cached_property
+    def terraform_outputs(self) -> dict[str, OutputDefinition]:
+        """Terraform output definitions, extracted on first access."""
+        return self.output_extractor.extract_outputs_from_index(self._plan_index)
+
+    @cached_property
+    def tosca_outputs(self) -> dict[str, ToscaOutputDefinition]:
+        """TOSCA output definitions converted from the Terraform outputs."""
+        return self.output_extractor.convert_to_tosca_outputs(self.terraform_outputs)
+
     def has_variables(self) -> bool:
         """Check if the Terraform project has any variables."""
         return len(self.terraform_variables) > 0
@@ -1092,23 +1544,17 @@ class VariableContext:
         Returns:
             Dictionary of TOSCA output definitions with properly mapped values
         """
-        mapped_outputs = {}
-
-        for output_name, tosca_output in self.tosca_outputs.items():
-            terraform_output = self.terraform_outputs[output_name]
-            mapped_value = self.output_mapper.map_output_value(
-                terraform_output, tosca_nodes
-            )
-
-            # Create new TOSCA output with mapped value
-            mapped_output = ToscaOutputDefinition(
+        # tosca_outputs is keyed by a subset of terraform_outputs
+        terraform_outputs = self.terraform_outputs
+        map_output_value = self.output_mapper.map_output_value
+        return {
+            output_name: ToscaOutputDefinition(
                 name=output_name,
                 description=tosca_output.description,
-                value=mapped_value,
+                value=map_output_value(terraform_outputs[output_name], tosca_nodes),
             )
-            mapped_outputs[output_name] = mapped_output
-
-        return mapped_outputs
+            for output_name, tosca_output in self.tosca_outputs.items()
+        }
 
     def resolve_property(
         self, resource_address: str, property_name: str, context: str = "property"
@@ -1118,6 +1564,17 @@ class VariableContext:
             resource_address, property_name, context
         )
 
+    def resolve_resource_properties(
+        self,
+        resource_address: str,
+        property_names: Iterable[str],
+        context: str = "property",
+    ) -> dict[str, Any]:
+        """Resolve several properties of one resource considering variable context."""
+        return self.property_resolver.resolve_property_values(
+            resource_address, property_names, context
+        )
+
     def is_variable_backed(self, resource_address: str, property_name: str) -> bool:
         """Check if a property is backed by a variable."""
         return self.reference_tracker.is_variable_reference(
@@ -1137,56 +1594,65 @@ class VariableContext:
         return self.reference_tracker.get_variable_name(resource_address, property_name)
 
     def log_variable_usage_summary(self):
-        """Log a summary of variable usage for debugging."""
+        """
+        Log a summary of variable usage for debugging.
+
+        Note that this materializes all lazily extracted variables and outputs,
+        unless INFO logging is disabled, in which case nothing is computed.
+        """
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
+
         self._logger.info("=== Variable Usage Summary ===")
-        self._logger.info(f"Total variables: {len(self.terraform_variables)}")
-        self._logger.info(f"Total TOSCA inputs: {len(self.tosca_inputs)}")
-        self._logger.info(f"Total outputs: {len(self.terraform_outputs)}")
-        self._logger.info(f"Total TOSCA outputs: {len(self.tosca_outputs)}")
+        self._logger.info("Total variables: %d", len(self.terraform_variables))
+        self._logger.info("Total TOSCA inputs: %d", len(self.tosca_inputs))
+        self._logger.info("Total outputs: %d", len(self.terraform_outputs))
+        self._logger.info("Total TOSCA outputs: %d", len(self.tosca_outputs))
 
         references = self.reference_tracker.get_all_variable_references()
         map_references = self.reference_tracker.get_all_map_variable_references()
         list_references = self.reference_tracker.get_all_list_variable_references()
-        self._logger.info(f"Total variable references: {len(references)}")
-        self._logger.info(f"Total map variable references: {len(map_references)}")
-        self._logger.info(f"Total list variable references: {len(list_references)}")
+        self._logger.info(
+            "Total variable references: %d", sum(map(len, references.values()))
+        )
+        self._logger.info("Total map variable references: %d", len(map_references))
+        self._logger.info("Total list variable references: %d", len(list_references))
 
         # Group references by variable
-        var_usage = {}
-        for (resource_addr, prop_name), var_name in references.items():
-            if var_name not in var_usage:
-                var_usage[var_name] = []
-            var_usage[var_name].append(f"{resource_addr}.{prop_name}")
+        var_usage: defaultdict[str, list[str]] = defaultdict(list)
+        for resource_addr, props in references.items():
+            for prop_name, var_name in props.items():
+                var_usage[var_name].append(f"{resource_addr}.{prop_name}")
 
         for var_name, usages in var_usage.items():
-            self._logger.info(f"Variable '{var_name}' used in: {', '.join(usages)}")
+            self._logger.info("Variable '%s' used in: %s", var_name, ", ".join(usages))
 
         # Group map variable references
-        map_var_usage = {}
+        map_var_usage: defaultdict[str, list[str]] = defaultdict(list)
         for (resource_addr, prop_name), (var_name, key) in map_references.items():
-            if var_name not in map_var_usage:
-                map_var_usage[var_name] = []
             map_var_usage[var_name].append(f"{resource_addr}.{prop_name}[{key}]")
 
         for var_name, usages in map_var_usage.items():
-            self._logger.info(f"Map variable '{var_name}' used in: {', '.join(usages)}")
+            self._logger.info(
+                "Map variable '%s' used in: %s", var_name, ", ".join(usages)
+            )
 
         # Group list variable references
-        list_var_usage = {}
+        list_var_usage: defaultdict[str, list[str]] = defaultdict(list)
         for (resource_addr, prop_name), (var_name, index) in list_references.items():
-            if var_name not in list_var_usage:
-                list_var_usage[var_name] = []
             list_var_usage[var_name].append(f"{resource_addr}.{prop_name}[{index}]")
 
         for var_name, usages in list_var_usage.items():
             self._logger.info(
-                f"List variable '{var_name}' used in: {', '.join(usages)}"
+                "List variable '%s' used in: %s", var_name, ", ".join(usages)
             )
 
         # Log output information
         for output_name, output_def in self.terraform_outputs.items():
             value_type = "resolved" if output_def.value is not None else "unresolved"
             sensitive_flag = " (sensitive)" if output_def.sensitive else ""
-            self._logger.info(f"Output '{output_name}': {value_type}{sensitive_flag}")
+            self._logger.info(
+                "Output '%s': %s%s", output_name, value_type, sensitive_flag
+            )
 
         self._logger.info("=== End Variable Usage Summary ===")
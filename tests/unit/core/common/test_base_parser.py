@@ -35,19 +35,50 @@ class EmptyExtensionsParser(BaseSourceFileParser):
         return {"content": content}
 
 
+class RaisingExtensionsParser(ConcreteTestParser):
+    """Parser whose extension lookup fails, for can_parse error paths."""
+
+    def get_supported_extensions(self) -> list[str]:
+        raise RuntimeError("boom")
+
+
+class NoSuperInitParser(ConcreteTestParser):
+    """Parser whose __init__ skips BaseSourceFileParser.__init__."""
+
+    def __init__(self) -> None:
+        self.encoding = "utf-8"
+
+
+# ------------------------- Fixtures -------------------------
+
+
+@pytest.fixture(scope="module")
+def parser() -> ConcreteTestParser:
+    # The parser holds no per-file state, so one instance serves every test
+    return ConcreteTestParser()
+
+
+@pytest.fixture(scope="session")
+def sample_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory with the sample files shared by the read-only tests."""
+    d = tmp_path_factory.mktemp("base_parser")
+    (d / "sample.test").write_text("test content")
+    (d / "main.tf.json").write_text("content")
+    (d / "x.invalid").write_text("content")
+    (d / "error.test").write_text("invalid")
+    (d / "bad.test").write_bytes(b"\x80\x81\x82")
+    return d
+
+
+@pytest.fixture
+def temp_file(sample_dir: Path) -> Path:
+    return sample_dir / "sample.test"
+
+
 # ------------------------- Tests -------------------------
 
 
 class TestBaseSourceFileParser:
-    @pytest.fixture
-    def parser(self) -> ConcreteTestParser:
-        return ConcreteTestParser()
-
-    @pytest.fixture
-    def temp_file(self, tmp_path: Path) -> Path:
-        f = tmp_path / "sample.test"
-        f.write_text("test content")
-        return f
 
     # --- capabilities & can_parse ---
 
@@ -60,39 +91,41 @@ class TestBaseSourceFileParser:
         assert parser.can_parse(temp_file) is True
 
     def test_can_parse_invalid_extension(
-        self, parser: ConcreteTestParser, tmp_path: Path
+        self, parser: ConcreteTestParser, sample_dir: Path
     ) -> None:
-        f = tmp_path / "x.invalid"
-        f.write_text("content")
-        assert parser.can_parse(f) is False
+        assert parser.can_parse(sample_dir / "x.invalid") is False
 
     def test_can_parse_multi_part_extension(
-        self, parser: ConcreteTestParser, tmp_path: Path
+        self, parser: ConcreteTestParser, sample_dir: Path
     ) -> None:
-        f = tmp_path / "main.tf.json"
-        f.write_text("content")
-        assert parser.can_parse(f) is True
+        assert parser.can_parse(sample_dir / "main.tf.json") is True
 
     def test_can_parse_nonexistent_file(
-        self, parser: ConcreteTestParser, tmp_path: Path
+        self, parser: ConcreteTestParser, sample_dir: Path
     ) -> None:
-        assert parser.can_parse(tmp_path / "missing.test") is False
+        assert parser.can_parse(sample_dir / "missing.test") is False
 
-    def test_can_parse_returns_false_on_exception(
-        self,
-        parser: ConcreteTestParser,
-        monkeypatch: pytest.MonkeyPatch,
-        tmp_path: Path,
-    ) -> None:
+    def test_can_parse_returns_false_on_exception(self, temp_file: Path) -> None:
         # Force an internal exception: can_parse must return False
-        monkeypatch.setattr(
-            parser,
-            "get_supported_extensions",
-            lambda: 1 / 0,  # type: ignore
-        )
-        f = tmp_path / "a.test"
-        f.write_text("x")
-        assert parser.can_parse(f) is False
+        assert RaisingExtensionsParser().can_parse(temp_file) is False
+
+    def test_supported_extensions_are_read_once(self, temp_file: Path) -> None:
+        p = ConcreteTestParser()
+        calls = 0
+        original = p.get_supported_extensions
+
+        def counting() -> list[str]:
+            nonlocal calls
+            calls += 1
+            return original()
+
+        p.get_supported_extensions = counting  # type: ignore[method-assign]
+        assert p.can_parse(temp_file) is True
+        p.validate_file(temp_file)
+        assert calls == 1
+
+    def test_can_parse_without_base_init(self, temp_file: Path) -> None:
+        assert NoSuperInitParser().can_parse(temp_file) is True
 
     # --- validate_file ---
 
@@ -102,31 +135,36 @@ class TestBaseSourceFileParser:
         parser.validate_file(temp_file)  # should not raise
 
     def test_validate_file_multi_part_extension_ok(
-        self, parser: ConcreteTestParser, tmp_path: Path
+        self, parser: ConcreteTestParser, sample_dir: Path
     ) -> None:
-        f = tmp_path / "main.tf.json"
-        f.write_text("x")
-        parser.validate_file(f)  # should not raise after patch
+        # should not raise after patch
+        parser.validate_file(sample_dir / "main.tf.json")
 
     def test_validate_file_not_found(
+        self, parser: ConcreteTestParser, sample_dir: Path
+    ) -> None:
+        with pytest.raises(FileNotFoundError):
+            parser.validate_file(sample_dir / "missing.test")
+
+    def test_validate_file_symlink_loop_is_not_found(
         self, parser: ConcreteTestParser, tmp_path: Path
     ) -> None:
+        loop = tmp_path / "loop.test"
+        loop.symlink_to(loop)
         with pytest.raises(FileNotFoundError):
-            parser.validate_file(tmp_path / "missing.test")
+            parser.validate_file(loop)
 
     def test_validate_file_directory(
-        self, parser: ConcreteTestParser, tmp_path: Path
+        self, parser: ConcreteTestParser, sample_dir: Path
     ) -> None:
         with pytest.raises(ValueError, match="Path is not a file"):
-            parser.validate_file(tmp_path)
+            parser.validate_file(sample_dir)
 
     def test_validate_file_unsupported_extension(
-        self, parser: ConcreteTestParser, tmp_path: Path
+        self, parser: ConcreteTestParser, sample_dir: Path
     ) -> None:
-        f = tmp_path / "x.invalid"
-        f.write_text("x")
         with pytest.raises(ValueError, match="Unsupported file extension"):
-            parser.validate_file(f)
+            parser.validate_file(sample_dir / "x.invalid")
 
     # --- I/O & parse workflow ---
 
@@ -135,13 +173,18 @@ class TestBaseSourceFileParser:
     ) -> None:
         assert parser._read_file(temp_file) == "test content"
 
-    def test_read_file_encoding_error(
+    def test_read_file_keeps_line_endings(
         self, parser: ConcreteTestParser, tmp_path: Path
     ) -> None:
-        f = tmp_path / "bad.test"
-        f.write_bytes(b"\x80\x81\x82")
+        f = tmp_path / "crlf.test"
+        f.write_bytes(b"a\r\nb\n")
+        assert parser._read_file(f) == "a\r\nb\n"
+
+    def test_read_file_encoding_error(
+        self, parser: ConcreteTestParser, sample_dir: Path
+    ) -> None:
         with pytest.raises(UnicodeDecodeError):
-            parser._read_file(f)
+            parser._read_file(sample_dir / "bad.test")
 
     def test_parse_success(
         self,
@@ -157,25 +200,21 @@ class TestBaseSourceFileParser:
     def test_parse_with_parsing_error(
         self,
         parser: ConcreteTestParser,
-        tmp_path: Path,
+        sample_dir: Path,
         caplog: pytest.LogCaptureFixture,
     ) -> None:
         caplog.set_level(logging.ERROR)
-        f = tmp_path / "error.test"
-        f.write_text("invalid")
         with pytest.raises(ValueError, match="Test parsing error"):
-            parser.parse(f)
+            parser.parse(sample_dir / "error.test")
         assert any("Failed to parse" in r.message for r in caplog.records)
 
     # --- error handling & info ---
 
     def test_handle_parse_error_default_behavior(
-        self, parser: ConcreteTestParser, tmp_path: Path
+        self, parser: ConcreteTestParser, temp_file: Path
     ) -> None:
-        f = tmp_path / "x.test"
-        f.write_text("x")
         with pytest.raises(ValueError, match="boom"):
-            parser._handle_parse_error(ValueError("boom"), f)
+            parser._handle_parse_error(ValueError("boom"), temp_file)
 
     def test_get_parser_info(self, parser: ConcreteTestParser) -> None:
         info = parser.get_parser_info()
@@ -185,21 +224,17 @@ class TestBaseSourceFileParser:
         assert info["supported_extensions"] == [".test", ".tf.json"]
         assert info["encoding"] == "utf-8"
 
-    def test_custom_encoding(self, tmp_path: Path) -> None:
+    def test_custom_encoding(self) -> None:
         p = ConcreteTestParser(encoding="latin-1")
         assert p.encoding == "latin-1"
         assert p.get_parser_info()["encoding"] == "latin-1"
 
 
 class TestEmptyExtensionsParser:
-    def test_can_parse_any_file_when_no_extensions(self, tmp_path: Path) -> None:
+    def test_can_parse_any_file_when_no_extensions(self, sample_dir: Path) -> None:
         p = EmptyExtensionsParser()
-        f = tmp_path / "any.xyz"
-        f.write_text("x")
-        assert p.can_parse(f) is True
+        assert p.can_parse(sample_dir / "x.invalid") is True
 
-    def test_validate_file_with_no_extensions(self, tmp_path: Path) -> None:
+    def test_validate_file_with_no_extensions(self, sample_dir: Path) -> None:
         p = EmptyExtensionsParser()
-        f = tmp_path / "any.xyz"
-        f.write_text("x")
-        p.validate_file(f)  # should not raise
+        p.validate_file(sample_dir / "x.invalid")  # should not raise
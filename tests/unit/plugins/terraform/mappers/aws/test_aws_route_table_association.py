@@ -60,10 +60,9 @@ class FakeBuilder:
         self.nodes[name] = node
         return node
 
-    def get_node(self, name: str) -> FakeNode:
-        if name not in self.nodes:
-            raise KeyError(name)
-        return self.nodes[name]
+    def get_node(self, name: str) -> FakeNode | None:
+        # Mirror ServiceTemplateBuilder.get_node, which returns None on a miss
+        return self.nodes.get(name)
 
 
 class DummyCtx:
@@ -94,6 +93,21 @@ class DummyCtx:
         # Reuse the same logic from BaseResourceMapper for consistency
         return BaseResourceMapper.generate_tosca_node_name(address, resource_type)
 
+    def find_resource_address_by_id(
+        self, resource_id: str, resource_type: str
+    ) -> str | None:
+        # Root module resources in state, then planned_values
+        state_values = self.parsed_data.get("state", {}).get("values", {})
+        planned_values = self.parsed_data.get("planned_values", {})
+        for values in (state_values, planned_values):
+            for res in values.get("root_module", {}).get("resources", []):
+                if (
+                    res.get("type") == resource_type
+                    and res.get("values", {}).get("id") == resource_id
+                ):
+                    return res.get("address")
+        return None
+
 
 class TestCanMap:
     def test_true_for_assoc(self) -> None:
@@ -318,3 +332,84 @@ class TestValidationFailures:
             "Could not resolve subnet or gateway reference" in r.message
             for r in caplog.records
         )
+
+    def test_missing_route_table_node_warns_once(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        caplog.set_level("WARNING")
+        m = AWSRouteTableAssociationMapper()
+        b = FakeBuilder()
+
+        refs = [
+            ("subnet_id", "aws_subnet.public", "DependsOn"),
+            ("gateway_id", "aws_internet_gateway.main", "DependsOn"),
+            ("route_table_id", "aws_route_table.public", "DependsOn"),
+        ]
+        ctx = DummyCtx(refs=refs)
+
+        subnet_node_name = BaseResourceMapper.generate_tosca_node_name(
+            "aws_subnet.public", "aws_subnet"
+        )
+        b.add_node(subnet_node_name, "Network")
+
+        m.map_resource(
+            "aws_route_table_association.no_rtb",
+            "aws_route_table_association",
+            {"values": {"subnet_id": "subnet-123"}},
+            b,
+            context=ctx,
+        )
+
+        warnings = [r for r in caplog.records if "Route table node" in r.message]
+        assert len(warnings) == 1
+        assert b.get_node(subnet_node_name).requirements == []
+
+    def test_missing_gateway_node_skips(self, caplog: pytest.LogCaptureFixture) -> None:
+        caplog.set_level("WARNING")
+        m = AWSRouteTableAssociationMapper()
+        b = FakeBuilder()
+
+        refs = [
+            ("gateway_id", "aws_nat_gateway.main", "DependsOn"),
+            ("route_table_id", "aws_route_table.public", "DependsOn"),
+        ]
+        ctx = DummyCtx(refs=refs)
+
+        rtb_node_name = BaseResourceMapper.generate_tosca_node_name(
+            "aws_route_table.public", "aws_route_table"
+        )
+        b.add_node(rtb_node_name, "Network")
+
+        m.map_resource(
+            "aws_route_table_association.no_gw",
+            "aws_route_table_association",
+            {"values": {"gateway_id": "nat-123"}},
+            b,
+            context=ctx,
+        )
+
+        assert any(
+            "Gateway node" in r.message and "aws_nat_gateway mapper" in r.message
+            for r in caplog.records
+        )
+
+
+class TestDetermineGatewayType:
+    @pytest.mark.parametrize(
+        ("address", "expected"),
+        [
+            ("aws_internet_gateway.main", "aws_internet_gateway"),
+            (
+                "aws_egress_only_internet_gateway.v6",
+                "aws_egress_only_internet_gateway",
+            ),
+            ("module.vpc.aws_nat_gateway.this[0]", "aws_nat_gateway"),
+            ("aws_vpn_gateway_main", "aws_vpn_gateway"),
+            ("aws_subnet.public", None),
+            # Leftmost type wins when an address names several gateway types
+            ("aws_nat_gateway.to_aws_internet_gateway", "aws_nat_gateway"),
+        ],
+    )
+    def test_gateway_type(self, address: str, expected: str | None) -> None:
+        m = AWSRouteTableAssociationMapper()
+        assert m._determine_gateway_type(address) == expected
@@ -233,6 +233,47 @@ def test_extract_references_and_resolve(parsed_data):
     assert "DependsOn" in rel_for_subnet
 
 
+def test_configuration_index_is_built_once(parsed_data):
+    ctx = TerraformMappingContext(parsed_data=parsed_data, variable_context=None)
+
+    index = ctx._config_resources_by_address
+    assert "aws_nat_gateway.main[1]" in index
+    assert "aws_route.igw_route" in index
+
+    ctx.extract_terraform_references({"address": "aws_route.igw_route"})
+    assert ctx._config_resources_by_address is index
+
+
+def test_find_resource_address_by_id_prefers_state():
+    planned = {
+        "root_module": {
+            "resources": [
+                {"type": "aws_vpc", "address": "aws_vpc.b", "values": {"id": "v1"}},
+                {"type": "aws_vpc", "address": "aws_vpc.c", "values": {"id": "v2"}},
+            ]
+        }
+    }
+    state = {
+        "values": {
+            "root_module": {
+                "resources": [
+                    {"type": "aws_vpc", "address": "aws_vpc.a", "values": {"id": "v1"}}
+                ]
+            }
+        }
+    }
+    ctx = TerraformMappingContext(
+        parsed_data={"state": state, "planned_values": planned},
+        variable_context=None,
+    )
+
+    assert ctx.find_resource_address_by_id("v1", "aws_vpc") == "aws_vpc.a"
+    assert ctx.find_resource_address_by_id("v2", "aws_vpc") == "aws_vpc.c"
+    assert ctx.find_resource_address_by_id("v2", "aws_subnet") is None
+    # _find_resource_by_id only looks at state
+    assert ctx._find_resource_by_id("v2", "aws_vpc") is None
+
+
 # ---------------------------------------------------------------------------
 # Test: filtro dipendenze (exclude target types)
 # ---------------------------------------------------------------------------
@@ -7,8 +7,14 @@ from unittest.mock import patch
 
 import pytest
 
+from src.plugins.provisioning.terraform import parser as parser_module
 from src.plugins.provisioning.terraform.parser import TerraformParser
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 @pytest.fixture
 def parser() -> TerraformParser:
@@ -118,6 +124,43 @@ def test_run_command_calledprocesserror_is_reraised(
             parser._run_command(["tflocal", "apply", "-auto-approve"], tf_dir)
 
 
+@pytest.fixture(
+    params=[
+        pytest.param(json.loads, id="json"),
+        pytest.param(
+            orjson.loads if orjson else None,
+            id="orjson",
+            marks=pytest.mark.skipif(orjson is None, reason="orjson not installed"),
+        ),
+    ]
+)
+def json_loads(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch):
+    """Run a test with both the orjson fast path and the json fallback."""
+    monkeypatch.setattr(parser_module, "_json_loads", request.param)
+    return request.param
+
+
+@pytest.mark.usefixtures("json_loads")
+def test_extract_state_decodes_with_either_loader(
+    parser: TerraformParser, tf_dir: Path
+) -> None:
+    fake_cp = subprocess.CompletedProcess(
+        args=[], returncode=0, stdout='{"values": {"root_module": {}}}'
+    )
+    with patch.object(parser, "_run_command", return_value=fake_cp):
+        assert parser._extract_complete_state(tf_dir) == {"values": {"root_module": {}}}
+
+
+@pytest.mark.usefixtures("json_loads")
+def test_extract_state_bad_json_with_either_loader(
+    parser: TerraformParser, tf_dir: Path
+) -> None:
+    fake_cp = subprocess.CompletedProcess(args=[], returncode=0, stdout="{not json")
+    with patch.object(parser, "_run_command", return_value=fake_cp):
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            parser._extract_complete_state(tf_dir)
+
+
 def test_extract_complete_state_success(parser: TerraformParser, tf_dir: Path) -> None:
     payload = {
         "values": {
@@ -2,6 +2,10 @@ from __future__ import annotations
 
 import pytest
 
+from src.plugins.provisioning.terraform.exceptions import (
+    OutputMappingError,
+    VariableExtractionError,
+)
 from src.plugins.provisioning.terraform.variables import (
     OutputDefinition,
     OutputExtractor,
@@ -9,8 +13,10 @@ from src.plugins.provisioning.terraform.variables import (
     PropertyResolver,
     ToscaInputDefinition,
     VariableContext,
+    VariableDefinition,
     VariableExtractor,
     VariableReferenceTracker,
+    _PlanIndex,
 )
 
 
@@ -188,6 +194,34 @@ def test_extract_variables_and_convert_to_tosca_inputs(parsed_data):
     assert secret.required is True  # no default
 
 
+def test_extract_and_convert_matches_two_step_conversion(parsed_data):
+    ve = VariableExtractor()
+    variables = ve.extract_variables(parsed_data)
+
+    fused_variables, fused_inputs = ve.extract_and_convert_from_index(
+        _PlanIndex.from_parsed_data(parsed_data)
+    )
+
+    assert fused_variables == variables
+    assert fused_inputs == ve.convert_to_tosca_inputs(variables)
+
+
+def test_extract_variables_wraps_malformed_plan_errors():
+    with pytest.raises(VariableExtractionError):
+        VariableExtractor().extract_variables({"plan": ["not", "a", "mapping"]})
+
+
+def test_convert_to_tosca_inputs_skips_invalid_definitions(parsed_data):
+    ve = VariableExtractor()
+    vars_map = dict(ve.extract_variables(parsed_data))
+    vars_map["bogus"] = {"type": "string"}
+
+    inputs = ve.convert_to_tosca_inputs(vars_map)
+
+    assert "bogus" not in inputs
+    assert inputs["env"].param_type == "string"
+
+
 # ---------------------------------------------------------------------------
 # OutputExtractor & conversion to TOSCA outputs
 # ---------------------------------------------------------------------------
@@ -314,6 +348,17 @@ def test_property_resolver_returns_get_input_or_concrete(parsed_data):
     assert v4 == "10.0.1.0/24"
 
 
+@pytest.mark.parametrize("context", ["property", "metadata"])
+def test_property_resolver_batch_matches_single_resolution(parsed_data, context):
+    pr = PropertyResolver(VariableReferenceTracker(parsed_data))
+
+    for address in ("aws_instance.web", "aws_subnet.example[0]", "missing.res"):
+        names = ["instance_type", "cidr_block", "name", "unknown"]
+        assert pr.resolve_property_values(address, names, context) == {
+            name: pr.resolve_property_value(address, name, context) for name in names
+        }
+
+
 # ---------------------------------------------------------------------------
 # VariableContext end-to-end integration
 # ---------------------------------------------------------------------------
@@ -356,3 +401,479 @@ def test_variable_context_end_to_end(parsed_data):
 
     # L’output costante rimane letterale
     assert mapped_outs["just_region"].value == "eu-west-1"
+
+
+def test_malformed_plan_raises_domain_errors():
+    malformed = {"plan": ["x"]}
+
+    with pytest.raises(VariableExtractionError):
+        VariableContext(malformed)
+    with pytest.raises(OutputMappingError):
+        OutputMapper(malformed)
+    with pytest.raises(OutputMappingError):
+        OutputExtractor().extract_outputs(malformed)
+
+
+def test_reference_tracker_extracts_nested_child_module_values():
+    data = {
+        "plan": {
+            "configuration": {"root_module": {}},
+            "planned_values": {
+                "root_module": {
+                    "resources": [
+                        {"address": "aws_vpc.main", "values": {"cidr_block": "10/8"}}
+                    ],
+                    "child_modules": [
+                        {
+                            "address": "module.net",
+                            "resources": [
+                                {"address": "aws_subnet.a", "values": {"id": "s-1"}}
+                            ],
+                            "child_modules": [
+                                {
+                                    "address": "module.net.module.deep",
+                                    "resources": [
+                                        {
+                                            "address": "aws_eip.ip",
+                                            "values": {"public_ip": "1.1.1.1"},
+                                        }
+                                    ],
+                                }
+                            ],
+                        }
+                    ],
+                }
+            },
+        }
+    }
+    tr = VariableReferenceTracker(data)
+
+    assert tr.get_resolved_value("aws_vpc.main", "cidr_block") == "10/8"
+    assert tr.get_resolved_value("module.net.aws_subnet.a", "id") == "s-1"
+    assert (
+        tr.get_resolved_value("module.net.module.deep.aws_eip.ip", "public_ip")
+        == "1.1.1.1"
+    )
+
+
+def test_output_mapper_resolves_planned_resource_addresses():
+    data = {
+        "plan": {
+            "configuration": {
+                "root_module": {
+                    "outputs": {
+                        "ip": {
+                            "expression": {
+                                "references": ['aws_eip.ip["a.b"].public_ip']
+                            }
+                        }
+                    }
+                }
+            },
+            "planned_values": {
+                "root_module": {
+                    "child_modules": [
+                        {
+                            "address": "module.net",
+                            "resources": [
+                                {
+                                    "address": 'module.net.aws_eip.ip["a.b"]',
+                                    "values": {"public_ip": "1.1.1.1"},
+                                },
+                            ],
+                        }
+                    ],
+                    "resources": [
+                        {"address": 'aws_eip.ip["a.b"]', "values": {}},
+                    ],
+                }
+            },
+        }
+    }
+    tr = VariableReferenceTracker(data)
+
+    # Already-qualified child module addresses are not prefixed twice
+    assert tr.get_planned_resource('module.net.aws_eip.ip["a.b"]') is not None
+    assert tr.get_resolved_value('module.net.aws_eip.ip["a.b"]', "public_ip") == (
+        "1.1.1.1"
+    )
+
+    mapper = OutputMapper(data, resources_by_address=tr.get_all_planned_resources())
+    assert mapper._extract_resource_reference("ip") == (
+        'aws_eip.ip["a.b"]',
+        "public_ip",
+    )
+
+
+def test_output_mapper_maps_module_qualified_references():
+    data = {
+        "plan": {
+            "configuration": {
+                "root_module": {
+                    "outputs": {
+                        "nat_ip": {
+                            "expression": {
+                                "references": [
+                                    'module.net["a.b"].aws_nat_gateway.gw.public_ip'
+                                ]
+                            }
+                        }
+                    }
+                }
+            },
+            "planned_values": {
+                "root_module": {
+                    "child_modules": [
+                        {
+                            "address": 'module.net["a.b"]',
+                            "resources": [
+                                {
+                                    "address": ('module.net["a.b"].aws_nat_gateway.gw'),
+                                    "values": {"public_ip": "2.2.2.2"},
+                                },
+                            ],
+                        }
+                    ]
+                }
+            },
+        }
+    }
+    tr = VariableReferenceTracker(data)
+    mapper = OutputMapper(data, resources_by_address=tr.get_all_planned_resources())
+    od = OutputDefinition(
+        name="nat_ip", description=None, sensitive=False, value="2.2.2.2"
+    )
+
+    # The resource type is taken after the module path, not from "module"
+    assert mapper.map_output_value(
+        od, {'module.net["a.b"].aws_nat_gateway.gw': "nat_gw"}
+    ) == {"$get_attribute": ["nat_gw", "network_address"]}
+
+
+def test_output_mapper_uses_first_segment_of_nested_attribute(parsed_data):
+    outputs = parsed_data["plan"]["configuration"]["root_module"]["outputs"]
+    outputs["vpc_cidr"] = {
+        "expression": {"references": ["aws_vpc.main.cidr_block.extra"]}
+    }
+    mapper = OutputMapper(parsed_data)
+
+    assert mapper._extract_resource_reference("vpc_cidr") == (
+        "aws_vpc.main",
+        "cidr_block",
+    )
+
+
+def test_get_all_references_are_read_only_views(parsed_data):
+    tr = VariableReferenceTracker(parsed_data)
+    refs = tr.get_all_variable_references()
+
+    assert refs["aws_instance.web"]["instance_type"] == "instance_type"
+    with pytest.raises(TypeError):
+        refs["aws_instance.web"] = {}  # type: ignore[index]
+
+    for view in (
+        tr.get_all_map_variable_references(),
+        tr.get_all_list_variable_references(),
+    ):
+        with pytest.raises(TypeError):
+            view[("aws_instance.web", "tags")] = ("x", 0)  # type: ignore[index]
+
+
+def test_variable_context_extracts_outputs_lazily(parsed_data):
+    ctx = VariableContext(parsed_data)
+
+    assert "terraform_outputs" not in vars(ctx)
+    assert "tosca_outputs" not in vars(ctx)
+
+    assert ctx.has_outputs() is True
+    assert "terraform_outputs" in vars(ctx)
+
+
+def test_reference_tracker_honours_known_variables(parsed_data):
+    tr = VariableReferenceTracker(parsed_data, known_variables=set())
+    assert not tr.is_variable_reference("aws_instance.web", "instance_type")
+    # Concrete values are still available for metadata
+    assert tr.get_resolved_value("aws_instance.web", "instance_type") == "t3.micro"
+
+    tr = VariableReferenceTracker(parsed_data, known_variables={"cidr_map"})
+    assert tr.get_variable_name("aws_instance.web", "instance_type") is None
+    assert tr.get_variable_name("aws_subnet.example[0]", "cidr_block") == "cidr_map"
+
+
+def test_reference_tracker_ignores_non_variable_references(parsed_data):
+    resources = parsed_data["plan"]["configuration"]["root_module"]["resources"]
+    resources[0]["expressions"]["subnet_id"] = {
+        "references": ["aws_subnet.example[0].id", "local.subnet", "variable.x"]
+    }
+
+    tr = VariableReferenceTracker(parsed_data)
+
+    assert tr.get_variable_name("aws_instance.web", "subnet_id") is None
+    assert tr.get_variable_name("aws_instance.web", "instance_type") == (
+        "instance_type"
+    )
+
+
+@pytest.mark.parametrize(
+    ("terraform_type", "expected"),
+    [
+        ("string", ("string", None)),
+        ("number", ("float", None)),
+        ("list(string)", ("list", "string")),
+        ("map(number)", ("map", "float")),
+        ("set(bool)", ("list", "boolean")),
+        ("object({name=string})", ("map", "string")),
+        ("tuple([string, number])", ("list", "string")),
+        ("mystery(string)", ("string", None)),
+    ],
+)
+def test_map_terraform_type_to_tosca(terraform_type, expected):
+    assert VariableExtractor()._map_terraform_type_to_tosca(terraform_type) == expected
+
+
+def test_map_pattern_prefers_first_declared_variable():
+    data = {
+        "plan": {
+            "configuration": {
+                "root_module": {
+                    "variables": {
+                        "by_key": {"default": {"a": "x", "b": "y"}},
+                        "by_value": {"default": {"other": "10.0.0.0/16"}},
+                        "tagged": {"default": {"t": ["p", "q"]}},
+                    }
+                }
+            },
+            "planned_values": {
+                "root_module": {
+                    "resources": [
+                        {
+                            "address": 'aws_vpc.main["b"]',
+                            "values": {"cidr_block": "10.0.0.0/16"},
+                        },
+                        {
+                            "address": "aws_vpc.other",
+                            "values": {
+                                "cidr_block": "10.0.0.0/16",
+                                "tags": ["p", "q"],
+                            },
+                        },
+                    ]
+                }
+            },
+        }
+    }
+    tr = VariableReferenceTracker(data)
+
+    # Address key match on the first variable wins over a value match later on
+    assert tr.get_map_variable_reference('aws_vpc.main["b"]', "cidr_block") == (
+        "by_key",
+        "b",
+    )
+    assert tr.get_map_variable_reference("aws_vpc.other", "cidr_block") == (
+        "by_value",
+        "other",
+    )
+    # Unhashable values are still matched by equality
+    assert tr.get_map_variable_reference("aws_vpc.other", "tags") == ("tagged", "t")
+
+
+def test_list_pattern_prefers_first_declared_variable():
+    data = {
+        "plan": {
+            "configuration": {
+                "root_module": {
+                    "variables": {
+                        "by_index": {"default": ["x", "y"]},
+                        "by_value": {"default": ["a", "10.0.0.0/16", "10.0.0.0/16"]},
+                        "nested": {"default": [["p", "q"]]},
+                    }
+                }
+            },
+            "planned_values": {
+                "root_module": {
+                    "resources": [
+                        {
+                            "address": "aws_vpc.main[1]",
+                            "values": {"cidr_block": "10.0.0.0/16"},
+                        },
+                        {
+                            "address": "aws_vpc.other",
+                            "values": {
+                                "cidr_block": "10.0.0.0/16",
+                                "tags": ["p", "q"],
+                            },
+                        },
+                    ]
+                }
+            },
+        }
+    }
+    tr = VariableReferenceTracker(data)
+
+    # Address index match on the first variable wins over a value match later on
+    assert tr.get_list_variable_reference("aws_vpc.main[1]", "cidr_block") == (
+        "by_index",
+        1,
+    )
+    # The first matching position is used, as with list.index()
+    assert tr.get_list_variable_reference("aws_vpc.other", "cidr_block") == (
+        "by_value",
+        1,
+    )
+    # Unhashable values are still matched by equality
+    assert tr.get_list_variable_reference("aws_vpc.other", "tags") == ("nested", 0)
+
+
+def test_map_pattern_matches_nested_values_by_equality():
+    data = {
+        "plan": {
+            "configuration": {
+                "root_module": {
+                    "variables": {
+                        "settings": {
+                            "default": {"web": {"size": 1, "zones": ["a", "b"]}}
+                        },
+                    }
+                }
+            },
+            "planned_values": {
+                "root_module": {
+                    "resources": [
+                        {
+                            "address": "aws_instance.web",
+                            "values": {
+                                "config": {"zones": ["a", "b"], "size": 1},
+                                "other": {"zones": ["b", "a"], "size": 1},
+                            },
+                        },
+                    ]
+                }
+            },
+        }
+    }
+    tr = VariableReferenceTracker(data)
+
+    assert tr.get_map_variable_reference("aws_instance.web", "config") == (
+        "settings",
+        "web",
+    )
+    assert tr.get_map_variable_reference("aws_instance.web", "other") is None
+
+
+def test_patterns_only_match_root_module_resources():
+    data = {
+        "plan": {
+            "configuration": {
+                "root_module": {
+                    "variables": {
+                        "cidrs": {"default": {"main": "10.0.0.0/16"}},
+                        "zones": {"default": ["eu-west-1a"]},
+                    }
+                }
+            },
+            "planned_values": {
+                "root_module": {
+                    "resources": [
+                        {
+                            "address": "aws_vpc.main",
+                            "values": {"cidr_block": "10.0.0.0/16"},
+                        },
+                    ],
+                    "child_modules": [
+                        {
+                            "address": "module.net",
+                            "resources": [
+                                {
+                                    "address": "module.net.aws_subnet.a",
+                                    "values": {
+                                        "cidr_block": "10.0.0.0/16",
+                                        "availability_zone": "eu-west-1a",
+                                    },
+                                },
+                            ],
+                        }
+                    ],
+                }
+            },
+        }
+    }
+    tr = VariableReferenceTracker(data)
+
+    assert tr.get_map_variable_reference("aws_vpc.main", "cidr_block") == (
+        "cidrs",
+        "main",
+    )
+    # Child module values equal to root variable entries are not references
+    assert (
+        tr.get_map_variable_reference("module.net.aws_subnet.a", "cidr_block") is None
+    )
+    assert (
+        tr.get_list_variable_reference("module.net.aws_subnet.a", "availability_zone")
+        is None
+    )
+    assert tr.get_resolved_value("module.net.aws_subnet.a", "cidr_block") == (
+        "10.0.0.0/16"
+    )
+
+
+def test_property_reference_prefers_map_over_plain_reference():
+    data = {
+        "plan": {
+            "configuration": {
+                "root_module": {
+                    "variables": {"cidrs": {"default": {"main": "10.0.0.0/16"}}},
+                    "resources": [
+                        {
+                            "address": "aws_vpc.main",
+                            "expressions": {
+                                "cidr_block": {"references": ["var.cidrs"]}
+                            },
+                        }
+                    ],
+                }
+            },
+            "planned_values": {
+                "root_module": {
+                    "resources": [
+                        {
+                            "address": "aws_vpc.main",
+                            "values": {"cidr_block": "10.0.0.0/16"},
+                        }
+                    ]
+                }
+            },
+        }
+    }
+    tr = VariableReferenceTracker(data)
+    resolver = PropertyResolver(tr)
+
+    assert tr.get_variable_name("aws_vpc.main", "cidr_block") == "cidrs"
+    assert tr.get_property_reference("aws_vpc.main", "cidr_block") == (
+        "map",
+        "cidrs",
+        "main",
+    )
+    assert tr.get_property_reference("aws_vpc.main", "missing") is None
+    assert resolver.resolve_property_value("aws_vpc.main", "cidr_block") == {
+        "$get_input": ["cidrs", "main"]
+    }
+
+
+@pytest.mark.parametrize(
+    "resource_address, expected",
+    [
+        ("aws_subnet.example[1]", ("subnets", 1)),
+        ('aws_subnet.example["2"]', ("subnets", 2)),
+        ("module.net[0].aws_subnet.example[2]", ("subnets", 2)),
+        ('aws_subnet.example["a"]', None),
+        ("aws_subnet.example[3]", None),
+        ("aws_subnet.example", None),
+    ],
+)
+def test_match_list_address_uses_resource_index(resource_address, expected):
+    tr = VariableReferenceTracker({})
+    list_variables = {
+        "subnets": VariableDefinition(name="subnets", default=["a", "b", "c"])
+    }
+
+    assert tr._match_list_address(resource_address, list_variables) == expected